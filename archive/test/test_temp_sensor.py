@@ -6,7 +6,8 @@ This script tests the MCP9808 I2C temperature sensor and helps diagnose
 connection issues.
 
 Run on Raspberry Pi:
-    python3 test_temp_sensor.py
+    python3 test_temp_sensor.py           # probe MCP9808 addresses, scan if absent
+    python3 test_temp_sensor.py --scan    # always scan the whole bus
 
 Requirements:
     - I2C must be enabled (dtparam=i2c_arm=on in /boot/config.txt or /boot/firmware/config.txt)
@@ -89,50 +90,92 @@ def check_i2c_permissions(bus_num):
     return False
 
 
-def scan_i2c_bus(bus_num):
-    """Scan I2C bus for devices."""
-    print("\n" + "=" * 50)
-    print(f"Step 3: Scanning I2C Bus {bus_num} for Devices")
-    print("=" * 50)
+def read_reg16(bus, addr, reg):
+    """Read a big-endian 16-bit register in one combined I2C transaction.
+
+    The register-pointer write and the 2-byte read are submitted together with
+    i2c_rdwr, so they go out as write + repeated START + read with no STOP in
+    between. The bus device is flock()ed for the transaction, so it does not
+    interleave with the app's temperature thread if the app is running.
+    """
+    import fcntl
+    import smbus2
+
+    write = smbus2.i2c_msg.write(addr, [reg])
+    read = smbus2.i2c_msg.read(addr, 2)
+    fcntl.flock(bus.fd, fcntl.LOCK_EX)
+    try:
+        bus.i2c_rdwr(write, read)
+    finally:
+        fcntl.flock(bus.fd, fcntl.LOCK_UN)
+    data = list(read)
+    return (data[0] << 8) | data[1]
+
+
+def probe_i2c_address(bus, addr):
+    """Return True if a device ACKs at addr.
+
+    Uses a zero-length SMBus quick write, the same probe `i2cdetect` uses by
+    default: one address byte on the wire, no data phase. Like `i2cdetect`,
+    EEPROM ranges are probed with a one-byte read instead, since a quick write
+    can change the address pointer on some parts.
+    """
+    try:
+        if 0x30 <= addr <= 0x37 or 0x50 <= addr <= 0x5F:
+            bus.read_byte(addr)
+        else:
+            bus.write_quick(addr)
+    except OSError:
+        return False  # NACK (or bus error): nothing there
+    return True
+
 
+def open_i2c_bus(bus_num):
+    """Open the I2C bus once for all diagnostic steps. Returns None on failure."""
     try:
         import smbus2
 
-        bus = smbus2.SMBus(bus_num)
+        return smbus2.SMBus(bus_num)
     except ImportError:
         print("  [ERROR] smbus2 not installed!")
         print("  Fix: pip install smbus2")
         print("  Or: sudo apt install python3-smbus")
-        return []
     except PermissionError:
         print(f"  [ERROR] Permission denied for /dev/i2c-{bus_num}")
         print("  Fix: Run with sudo or add user to i2c group")
-        return []
     except Exception as e:
         print(f"  [ERROR] Cannot open I2C bus: {e}")
-        return []
+    return None
+
+
+def probe_addresses(bus, addrs):
+    """Return the addresses in addrs that ACK, in order."""
+    return [addr for addr in addrs if probe_i2c_address(bus, addr)]
+
+
+def scan_i2c_bus(bus):
+    """Scan I2C bus for devices."""
+    print("\n" + "=" * 50)
+    print("Step 3: Scanning I2C Bus for Devices")
+    print("=" * 50)
 
     found_devices = []
     print(f"  Scanning addresses 0x03 to 0x77...")
 
     for addr in range(0x03, 0x78):
-        try:
-            bus.read_byte(addr)
-            found_devices.append(addr)
-            device_name = ""
-            if addr == 0x18:
-                device_name = " <- MCP9808 (default)"
-            elif addr == 0x19:
-                device_name = " <- MCP9808 (A0=1)"
-            elif addr == 0x68:
-                device_name = " <- DS3231 RTC"
-            elif addr == 0x3C or addr == 0x3D:
-                device_name = " <- OLED Display"
-            print(f"    [FOUND] 0x{addr:02X}{device_name}")
-        except:
-            pass
-
-    bus.close()
+        if not probe_i2c_address(bus, addr):
+            continue
+        found_devices.append(addr)
+        device_name = ""
+        if addr == 0x18:
+            device_name = " <- MCP9808 (default)"
+        elif addr == 0x19:
+            device_name = " <- MCP9808 (A0=1)"
+        elif addr == 0x68:
+            device_name = " <- DS3231 RTC"
+        elif addr == 0x3C or addr == 0x3D:
+            device_name = " <- OLED Display"
+        print(f"    [FOUND] 0x{addr:02X}{device_name}")
 
     if not found_devices:
         print("  [WARNING] No I2C devices found!")
@@ -147,24 +190,15 @@ def scan_i2c_bus(bus_num):
     return found_devices
 
 
-def test_mcp9808(bus_num, address=MCP9808_I2CADDR_DEFAULT):
+def test_mcp9808(bus, address=MCP9808_I2CADDR_DEFAULT):
     """Test MCP9808 sensor communication."""
     print("\n" + "=" * 50)
     print(f"Step 4: Testing MCP9808 at Address 0x{address:02X}")
     print("=" * 50)
 
-    try:
-        import smbus2
-
-        bus = smbus2.SMBus(bus_num)
-    except Exception as e:
-        print(f"  [ERROR] Cannot open I2C bus: {e}")
-        return False
-
     # Read Manufacturer ID (should be 0x0054)
     try:
-        data = bus.read_i2c_block_data(address, MCP9808_REG_MANUF_ID, 2)
-        manuf_id = (data[0] << 8) | data[1]
+        manuf_id = read_reg16(bus, address, MCP9808_REG_MANUF_ID)
         print(f"  Manufacturer ID: 0x{manuf_id:04X}", end="")
         if manuf_id == 0x0054:
             print(" [OK - Microchip]")
@@ -172,13 +206,11 @@ def test_mcp9808(bus_num, address=MCP9808_I2CADDR_DEFAULT):
             print(f" [UNEXPECTED - expected 0x0054]")
     except Exception as e:
         print(f"  [ERROR] Cannot read Manufacturer ID: {e}")
-        bus.close()
         return False
 
     # Read Device ID (should be 0x0400)
     try:
-        data = bus.read_i2c_block_data(address, MCP9808_REG_DEVICE_ID, 2)
-        device_id = (data[0] << 8) | data[1]
+        device_id = read_reg16(bus, address, MCP9808_REG_DEVICE_ID)
         print(f"  Device ID: 0x{device_id:04X}", end="")
         if device_id == 0x0400:
             print(" [OK - MCP9808]")
@@ -186,13 +218,11 @@ def test_mcp9808(bus_num, address=MCP9808_I2CADDR_DEFAULT):
             print(f" [UNEXPECTED - expected 0x0400]")
     except Exception as e:
         print(f"  [ERROR] Cannot read Device ID: {e}")
-        bus.close()
         return False
 
     # Read temperature
     try:
-        data = bus.read_i2c_block_data(address, MCP9808_REG_AMBIENT_TEMP, 2)
-        raw_temp = (data[0] << 8) | data[1]
+        raw_temp = read_reg16(bus, address, MCP9808_REG_AMBIENT_TEMP)
 
         # Convert to Celsius
         temp_c = (raw_temp & 0x0FFF) / 16.0
@@ -209,41 +239,42 @@ def test_mcp9808(bus_num, address=MCP9808_I2CADDR_DEFAULT):
 
     except Exception as e:
         print(f"  [ERROR] Cannot read temperature: {e}")
-        bus.close()
         return False
 
-    bus.close()
     return True
 
 
-def continuous_reading(bus_num, address=MCP9808_I2CADDR_DEFAULT, interval=2.0):
-    """Continuously read and display temperature."""
+def continuous_reading(bus, address=MCP9808_I2CADDR_DEFAULT, interval=2.0):
+    """Continuously read and display temperature.
+
+    The sensor is left in its power-on continuous conversion mode, shared with
+    the app's temperature thread, so each sample is a single register read
+    that returns straight away. Samples are paced against a fixed monotonic
+    cadence so the interval does not drift by the read time.
+    """
     print("\n" + "=" * 50)
     print("Step 5: Continuous Temperature Reading")
     print("=" * 50)
     print("Press Ctrl+C to stop\n")
 
-    import smbus2
     import time
 
-    bus = smbus2.SMBus(bus_num)
-
+    next_sample = time.monotonic()
     try:
         count = 0
         while True:
-            data = bus.read_i2c_block_data(address, MCP9808_REG_AMBIENT_TEMP, 2)
-            raw_temp = (data[0] << 8) | data[1]
+            raw_temp = read_reg16(bus, address, MCP9808_REG_AMBIENT_TEMP)
             temp_c = (raw_temp & 0x0FFF) / 16.0
             if raw_temp & 0x1000:
                 temp_c -= 256.0
 
             count += 1
             print(f"  [{count:4d}] Temperature: {temp_c:6.2f}°C  ({temp_c * 9/5 + 32:6.2f}°F)")
-            time.sleep(interval)
+
+            next_sample += interval
+            time.sleep(max(0.0, next_sample - time.monotonic()))
     except KeyboardInterrupt:
         print("\n  Stopped by user")
-    finally:
-        bus.close()
 
 
 def main():
@@ -251,6 +282,8 @@ def main():
     print("MCP9808 Temperature Sensor Diagnostic Test")
     print("=" * 50)
 
+    full_scan = "--scan" in sys.argv[1:]  # Always scan every address
+
     # Step 1: Check I2C bus
     bus_num = check_i2c_available()
     if bus_num is None:
@@ -261,46 +294,61 @@ def main():
         print("\n[TIP] Try running with sudo: sudo python3 test_temp_sensor.py")
         # Continue anyway to try
 
-    # Step 3: Scan bus
-    devices = scan_i2c_bus(bus_num)
-
-    # Check if MCP9808 found
-    mcp9808_addr = None
-    for addr in [0x18, 0x19, 0x1A, 0x1B, 0x1C, 0x1D, 0x1E, 0x1F]:  # Possible MCP9808 addresses
-        if addr in devices:
-            mcp9808_addr = addr
-            break
+    # Open the bus once and share it across steps 3-5
+    bus = open_i2c_bus(bus_num)
+    if bus is None:
+        sys.exit(1)
 
-    if mcp9808_addr is None:
+    try:
+        # Step 3: Find the MCP9808. Probe its 8 possible addresses first and
+        # only scan the whole bus if none answers (or --scan was given)
+        mcp9808_addrs = range(0x18, 0x20)  # Possible MCP9808 addresses
+        devices = [] if full_scan else probe_addresses(bus, mcp9808_addrs)
+        if devices:
+            print(f"\n  MCP9808 address probe: found {[f'0x{a:02X}' for a in devices]}"
+                  " (run with --scan for a full bus scan)")
+        else:
+            devices = scan_i2c_bus(bus)
+
+        # Check if MCP9808 found
+        mcp9808_addr = None
+        for addr in mcp9808_addrs:
+            if addr in devices:
+                mcp9808_addr = addr
+                break
+
+        if mcp9808_addr is None:
+            print("\n" + "=" * 50)
+            print("MCP9808 NOT DETECTED")
+            print("=" * 50)
+            print("Check wiring:")
+            print("  MCP9808 Pin  ->  Raspberry Pi Pin")
+            print("  ------------------------------------")
+            print("  VDD (power)  ->  3.3V (pin 1)")
+            print("  GND (ground) ->  GND (pin 6)")
+            print("  SDA (data)   ->  GPIO 2 / SDA (pin 3)")
+            print("  SCL (clock)  ->  GPIO 3 / SCL (pin 5)")
+            print("\nAddress pins (if present):")
+            print("  A0, A1, A2   ->  Leave floating or connect to GND for 0x18")
+            sys.exit(1)
+
+        # Step 4: Test MCP9808
+        if not test_mcp9808(bus, mcp9808_addr):
+            sys.exit(1)
+
+        # Step 5: Ask about continuous reading
         print("\n" + "=" * 50)
-        print("MCP9808 NOT DETECTED")
+        print("SUCCESS! MCP9808 is working correctly.")
         print("=" * 50)
-        print("Check wiring:")
-        print("  MCP9808 Pin  ->  Raspberry Pi Pin")
-        print("  ------------------------------------")
-        print("  VDD (power)  ->  3.3V (pin 1)")
-        print("  GND (ground) ->  GND (pin 6)")
-        print("  SDA (data)   ->  GPIO 2 / SDA (pin 3)")
-        print("  SCL (clock)  ->  GPIO 3 / SCL (pin 5)")
-        print("\nAddress pins (if present):")
-        print("  A0, A1, A2   ->  Leave floating or connect to GND for 0x18")
-        sys.exit(1)
-
-    # Step 4: Test MCP9808
-    if not test_mcp9808(bus_num, mcp9808_addr):
-        sys.exit(1)
 
-    # Step 5: Ask about continuous reading
-    print("\n" + "=" * 50)
-    print("SUCCESS! MCP9808 is working correctly.")
-    print("=" * 50)
-
-    try:
-        response = input("\nStart continuous temperature reading? (y/N): ")
-        if response.lower() == "y":
-            continuous_reading(bus_num, mcp9808_addr)
-    except EOFError:
-        pass  # Running non-interactively
+        try:
+            response = input("\nStart continuous temperature reading? (y/N): ")
+            if response.lower() == "y":
+                continuous_reading(bus, mcp9808_addr)
+        except EOFError:
+            pass  # Running non-interactively
+    finally:
+        bus.close()
 
     print("\nTest complete.")
 
@@ -56,6 +56,20 @@ FAN_THRESHOLD_MIN_C = 0  # Minimum threshold (0 = always on)
 FAN_THRESHOLD_MAX_C = 60  # Maximum threshold
 FAN_THRESHOLD_STEP_C = 5  # Step size for menu adjustment
 
+# Run the temperature/fan thread at idle priority so it never competes with
+# the spectrometer capture and UI threads (Linux only, ignored elsewhere)
+TEMP_THREAD_LOW_PRIO = True
+
+# CPU cores each thread role is pinned to (Linux only). Cores that do not exist
+# on the board are ignored, so single-core Pis simply run unpinned.
+CPU_CORES = {
+    "UI": {0},
+    "SPECTROMETER": {1},
+    "BACKGROUND": {2, 3},  # Leak, network, temperature and data manager threads
+}
+# SCHED_RR priority for the UI thread (0 = normal scheduling); needs CAP_SYS_NICE
+UI_THREAD_RT_PRIORITY = 10
+
 # Button Logical Names (used internally)
 BTN_UP = "up"
 BTN_DOWN = "down"
@@ -157,6 +171,8 @@ TEMP_UPDATE_INTERVAL_S = 10.0
 MAIN_LOOP_DELAY_S = 0.03
 SPECTRO_LOOP_DELAY_S = 0.05
 DIVISION_EPSILON = 1e-9
+RESULT_QUEUE_MAXSIZE = 2  # Spectrometer -> UI results; oldest dropped so the UI sees the freshest scan
+SAVE_QUEUE_MAXSIZE = 64  # UI -> data manager save requests; bounded to back-pressure save bursts
 
 
 ## @brief Spectrometer hardware configuration and limits.
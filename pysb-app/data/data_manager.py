@@ -23,6 +23,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 import config
+from hardware import cpu_affinity
 
 # ==============================================================================
 # MATPLOTLIB IMPORT (Non-GUI Backend)
@@ -174,6 +175,7 @@ class DataManager:
         #  3. Continues until shutdown_flag is set
         """
         print("DataManager: Thread loop started")
+        cpu_affinity.pin_current_thread("BACKGROUND")
 
         # Ensure data directory exists
         try:
@@ -35,11 +35,28 @@ class ButtonHandler:
 
     ##
     # @brief Initializes the ButtonHandler.
+    # @param wake_event Optional threading.Event set on every accepted GPIO press so a
+    #        waiting main loop handles the input immediately instead of at its next frame.
     # @details Sets up button state dictionaries, threading locks, and configures GPIO
     #          if hardware is available and enabled. Falls back to keyboard-only mode
     #          if GPIO is unavailable.
-    def __init__(self):
+    def __init__(self, wake_event=None):
         """Initializes the button handler, setting up GPIO if available."""
+        ## @var _wake_event
+        # @brief Event set after a GPIO press is recorded (None to disable).
+        self._wake_event = wake_event
+
+        ## @var _poll_pygame_events
+        # @brief False in PiTFT framebuffer mode, where SDL runs the dummy video driver
+        #        and never delivers keyboard events, so the event pump is skipped.
+        self._poll_pygame_events = not config.HARDWARE["USE_ADAFRUIT_PITFT"]
+
+        if self._poll_pygame_events and pygame.display.get_init():
+            # Only QUIT and KEYDOWN are ever read (see check_pygame_events());
+            # keep mouse, window and other events out of the queue entirely
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
         ## @var _button_states
         # @brief Dictionary mapping button names to their current state (True = pressed).
         self._button_states = {
@@ -52,6 +69,16 @@ class ButtonHandler:
             ]
         }
 
+        ## @var _button_bits
+        # @brief Bit assigned to each button in _pressed_mask.
+        self._button_bits = {
+            btn: 1 << i for i, btn in enumerate(self._button_states)
+        }
+
+        ## @var _pressed_mask
+        # @brief Bitfield of buttons with an unconsumed press (see any_pressed()).
+        self._pressed_mask = 0
+
         ## @var _state_lock
         # @brief Threading lock for thread-safe access to button states.
         self._state_lock = threading.Lock()
@@ -98,7 +125,7 @@ class ButtonHandler:
         try:
             # Try to cleanup all GPIO
             GPIO.cleanup()
-        except:
+        except Exception:
             pass  # Ignore if GPIO wasn't initialized
 
         # Small delay to let kernel release pins
@@ -165,7 +192,7 @@ class ButtonHandler:
             try:
                 GPIO.remove_event_detect(pin)
                 time.sleep(0.01)  # Small delay after removal
-            except:
+            except Exception:
                 pass  # Ignore if no edge detection was set
 
             # Add edge detection with hardware debouncing (with retry)
@@ -192,7 +219,7 @@ class ButtonHandler:
                             # Re-setup the pin as input after cleanup
                             GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
                             time.sleep(0.01)
-                        except:
+                        except Exception:
                             pass
                     else:
                         # Final attempt failed
@@ -223,19 +250,33 @@ class ButtonHandler:
         if (
             current_time - self._last_press_time[button_name]
         ) > config.DEBOUNCE_DELAY_S:
-            with self._state_lock:
-                self._button_states[button_name] = True
+            self._record_press(button_name)
             self._last_press_time[button_name] = current_time
+            if self._wake_event is not None:
+                self._wake_event.set()
             print(f"DEBUG: Button '{button_name}' pressed (GPIO {channel})")
 
+    ##
+    # @brief Marks a button as pressed until it is consumed by get_pressed().
+    # @param button_name The logical name of the button that was pressed.
+    def _record_press(self, button_name):
+        """Sets the pressed state and mask bit for a button."""
+        with self._state_lock:
+            self._button_states[button_name] = True
+            self._pressed_mask |= self._button_bits[button_name]
+
     ##
     # @brief Polls Pygame for keyboard events and updates button states.
     # @details This should be called once per frame in the main loop. Handles:
     #          - Pygame QUIT event → sets "shutdown" flag
     #          - Escape key → sets "shutdown" flag
     #          - Mapped keyboard keys → sets corresponding button states with debouncing
+    #          Does nothing in PiTFT framebuffer mode (no SDL video/event subsystem).
     def check_pygame_events(self):
         """Polls Pygame for keyboard events and updates button states."""
+        if not self._poll_pygame_events:
+            return  # PiTFT mode: buttons arrive via GPIO callbacks only
+
         # This should be called once per frame in the main loop
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -255,8 +296,7 @@ class ButtonHandler:
                     if (
                         current_time - self._last_press_time[button_name]
                     ) > config.DEBOUNCE_DELAY_S:
-                        with self._state_lock:
-                            self._button_states[button_name] = True
+                        self._record_press(button_name)
                         self._last_press_time[button_name] = current_time
 
     ##
@@ -270,9 +310,21 @@ class ButtonHandler:
         with self._state_lock:
             if self._button_states.get(button_name, False):
                 self._button_states[button_name] = False  # Consume the press
+                self._pressed_mask &= ~self._button_bits.get(button_name, 0)
                 return True
             return False
 
+    ##
+    # @brief Checks whether any navigation button has an unconsumed press.
+    # @return True if UP, DOWN, ENTER or BACK was pressed and not yet consumed.
+    # @details Lets screens skip their per-button get_pressed() checks on the vast
+    #          majority of frames with no input. Does not consume anything, and reads
+    #          the mask without taking the lock (a single int read is atomic; a press
+    #          landing just after the check is picked up on the next frame).
+    def any_pressed(self):
+        """Returns True if any button press is waiting to be consumed."""
+        return self._pressed_mask != 0
+
     ##
     # @brief Cleans up GPIO resources.
     # @details Calls GPIO.cleanup() if GPIO was initialized. Should be called during
@@ -284,14 +336,14 @@ class ButtonHandler:
             for pin in self._pin_to_button.keys():
                 try:
                     GPIO.remove_event_detect(pin)
-                except:
+                except Exception:
                     pass  # Ignore errors during cleanup
 
             # Then cleanup all GPIO
             try:
                 GPIO.cleanup()
                 print("INFO: GPIO cleaned up.")
-            except:
+            except Exception:
                 print(
                     "WARNING: GPIO cleanup encountered errors (this is usually safe to ignore)"
                 )
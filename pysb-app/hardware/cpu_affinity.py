@@ -0,0 +1,58 @@
+## @file cpu_affinity.py
+#  @brief Per-thread CPU pinning and scheduling priority helpers.
+#
+#  Keeps the UI, spectrometer and slow background threads on separate cores
+#  (see config.CPU_CORES) so they do not preempt each other on the Pi's small
+#  SoC. All functions act on the calling thread only and quietly do nothing
+#  where the OS or permissions do not allow it.
+
+import os
+
+import config
+
+
+##
+# @brief Pins the calling thread to the cores configured for a thread role.
+# @param role Key into config.CPU_CORES ("UI", "SPECTROMETER" or "BACKGROUND").
+# @return True if the affinity was changed, False otherwise.
+# @details Cores that do not exist on this board are ignored, so the same
+#          configuration works on 1- and 4-core Pis. If none of the configured
+#          cores exist the thread keeps its default affinity.
+def pin_current_thread(role):
+    cores = config.CPU_CORES.get(role)
+    if not cores:
+        return False
+
+    try:
+        # Compare against the board's cores, not this thread's current mask,
+        # which may have been inherited from an already-pinned parent thread
+        target = set(cores) & set(range(os.cpu_count() or 1))
+        if not target:
+            return False
+        os.sched_setaffinity(0, target)
+    except (AttributeError, OSError) as e:
+        print(f"INFO: Could not pin {role} thread to CPU {sorted(cores)}: {e}")
+        return False
+
+    print(f"INFO: {role} thread pinned to CPU {sorted(target)}")
+    return True
+
+
+##
+# @brief Moves the calling thread to the SCHED_RR real-time policy.
+# @param priority SCHED_RR priority (1-99); 0 or less leaves the thread unchanged.
+# @return True if the policy was changed, False otherwise.
+# @details Requires CAP_SYS_NICE (or root); without it the thread simply keeps
+#          normal scheduling.
+def raise_current_thread_priority(priority):
+    if priority <= 0:
+        return False
+
+    try:
+        os.sched_setscheduler(0, os.SCHED_RR, os.sched_param(priority))
+    except (AttributeError, OSError) as e:
+        print(f"INFO: Could not set SCHED_RR priority {priority}: {e}")
+        return False
+
+    print(f"INFO: Thread scheduling set to SCHED_RR (priority {priority})")
+    return True
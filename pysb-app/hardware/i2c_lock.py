@@ -0,0 +1,32 @@
+## @file i2c_lock.py
+#  @brief Shared guard for I2C bus transactions.
+#
+#  The MCP9808, the RTC and any future I2C peripherals sit on the same bus.
+#  Wrapping every transaction in i2c_txn() serialises access between threads
+#  of this process (i2c_lock) and, through an advisory flock() on the bus
+#  device, with other processes that do the same, such as the sensor
+#  diagnostic script run while the app is up.
+
+import fcntl
+import threading
+from contextlib import contextmanager
+
+## @brief Process-wide lock held for the duration of each I2C transaction.
+i2c_lock = threading.Lock()
+
+
+##
+# @brief Context manager that holds the bus exclusively for one transaction.
+# @param bus Open smbus2.SMBus instance (its fd is flock()ed).
+# @details Takes i2c_lock first, then an exclusive flock() on the bus file
+#          descriptor; both are released on exit, including on errors.
+#          Keep the body to a single logical transaction so other users of
+#          the bus are not held up.
+@contextmanager
+def i2c_txn(bus):
+    with i2c_lock:
+        fcntl.flock(bus.fd, fcntl.LOCK_EX)
+        try:
+            yield bus
+        finally:
+            fcntl.flock(bus.fd, fcntl.LOCK_UN)
@@ -6,9 +6,9 @@
 #  Sets the leak_detected_flag event to trigger emergency shutdown.
 
 import threading
-import time
 
 import config
+from hardware import cpu_affinity
 # No longer importing from main, which removes the circular dependency.
 
 try:
@@ -30,14 +30,17 @@ class LeakSensor(threading.Thread):
     # @brief Initializes the LeakSensor.
     # @param shutdown_flag A threading.Event to signal when the sensor should be disabled.
     # @param leak_detected_flag A threading.Event that will be set if a leak is detected.
+    # @param wake_event Optional threading.Event also set on a leak so a waiting main loop
+    #        shows the warning immediately.
     # @details Checks if the leak sensor is enabled in the config and if the GPIO
     #          library is available. If so, it sets up the GPIO pin with interrupt detection.
-    def __init__(self, shutdown_flag, leak_detected_flag):
+    def __init__(self, shutdown_flag, leak_detected_flag, wake_event=None):
         super().__init__(name="LeakSensorThread")
         self.daemon = True
 
         self.shutdown_flag = shutdown_flag
         self.leak_detected_flag = leak_detected_flag
+        self.wake_event = wake_event
 
         ## @var enabled
         # @brief Boolean indicating if the leak sensor monitoring is active.
@@ -67,7 +70,7 @@ class LeakSensor(threading.Thread):
         # Remove existing edge detection if present (from previous run)
         try:
             GPIO.remove_event_detect(self.pin)
-        except:
+        except Exception:
             pass  # Ignore if no edge detection was set
 
         # Add interrupt-based edge detection (triggers on HIGH->LOW transition)
@@ -90,6 +93,8 @@ class LeakSensor(threading.Thread):
         print(f"!!! WATER LEAK DETECTED on GPIO {channel} !!!")
         print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
         self.leak_detected_flag.set()
+        if self.wake_event is not None:
+            self.wake_event.set()
 
     ##
     # @brief The main execution method of the thread.
@@ -100,10 +105,11 @@ class LeakSensor(threading.Thread):
             return
 
         print("Leak sensor thread started (waiting for interrupts).")
+        cpu_affinity.pin_current_thread("BACKGROUND")
 
-        # Just wait for shutdown - leak detection is handled by GPIO interrupts
-        while not self.shutdown_flag.is_set():
-            time.sleep(1.0)  # Sleep to reduce CPU usage
+        # Just wait for shutdown - leak detection is handled by GPIO interrupts,
+        # so block on the flag instead of waking up every second
+        self.shutdown_flag.wait()
 
         print("Leak sensor thread finished.")
 
@@ -115,5 +121,5 @@ class LeakSensor(threading.Thread):
             try:
                 GPIO.remove_event_detect(self.pin)
                 print(f"INFO: Leak sensor edge detection removed from GPIO {self.pin}")
-            except:
+            except Exception:
                 pass  # Ignore errors during cleanup
@@ -7,9 +7,9 @@
 
 import subprocess
 import threading
-import time
 
 import config
+from hardware import cpu_affinity
 # No longer importing from main, which removes the circular dependency.
 
 ##
@@ -69,6 +69,7 @@ class NetworkInfo:
     # @details This loop runs until the injected `shutdown_flag` is set. It periodically
     #          checks the network status and updates the cached SSID and IP address.
     def _network_update_loop(self):
+        cpu_affinity.pin_current_thread("BACKGROUND")
         while not self.shutdown_flag.is_set():
             wifi_name = "Disconnected"
             ip_address = "N/A"
@@ -80,11 +81,8 @@ class NetworkInfo:
                 self._wifi_name = wifi_name
                 self._ip_address = ip_address
 
-            # Wait for the next update interval, checking the shutdown flag periodically
-            for _ in range(int(self._update_interval_s * 10)):
-                if self.shutdown_flag.is_set():
-                    break
-                time.sleep(0.1)
+            # Sleep until the next update interval (returns early on shutdown)
+            self.shutdown_flag.wait(timeout=self._update_interval_s)
 
     ##
     # @brief Thread-safe method to get the cached Wi-Fi SSID.
@@ -36,6 +36,7 @@ Session Validity:
 
 import threading
 import queue
+import collections
 import time
 import datetime
 import numpy as np
@@ -43,6 +44,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 import config
+from hardware import cpu_affinity
 
 # ==============================================================================
 # SEABREEZE LIBRARY IMPORT
@@ -108,6 +110,7 @@ class SpectrometerResult:
         raw_intensities: Raw intensities before reflectance calculation (only in REFLECTANCE mode)
         peak_adc_value: Peak ADC value from scan (for auto-integration, otherwise None)
         test_integration_us: Integration time in µs used for auto-integ capture (otherwise None)
+        buffer_pool: Pool that owns the intensity buffers (None if not pooled)
     """
 
     wavelengths: np.ndarray
@@ -122,6 +125,159 @@ class SpectrometerResult:
     raw_intensities: Optional[np.ndarray] = None
     peak_adc_value: Optional[float] = None
     test_integration_us: Optional[int] = None
+    buffer_pool: Optional["SpectrumBufferPool"] = None
+
+    def as_numpy(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return (wavelengths, intensities) as NumPy arrays without copying.
+
+        Consumers should read spectra through this helper so the payload
+        container can change (e.g. to array.array) without touching them.
+        """
+        return np.asarray(self.wavelengths), np.asarray(self.intensities)
+
+    def release(self):
+        """
+        Return pooled intensity buffers once the consumer no longer needs them.
+
+        Safe to call more than once, and a no-op for unpooled results.
+        """
+        pool = self.buffer_pool
+        if pool is not None:
+            self.buffer_pool = None
+            pool.release(self.intensities)
+            pool.release(self.raw_intensities)
+
+
+class SpectrumBufferPool:
+    """
+    Fixed set of reusable spectrum buffers shared by the controller and UI.
+
+    The controller fills a free buffer in place and ships it in a
+    SpectrometerResult; the UI hands it back via SpectrometerResult.release()
+    when it stops referencing the data. If every slot is still held,
+    acquire() falls back to a plain allocation so data is never overwritten.
+    """
+
+    def __init__(self, num_slots: int):
+        """
+        Initialize the pool.
+
+        Args:
+            num_slots: Maximum number of pooled buffers
+        """
+        assert num_slots > 0, "num_slots must be positive"
+        self._lock = threading.Lock()
+        self._num_slots = num_slots
+        self._buffers: list = []
+        self._in_use: list = []
+
+    def acquire(self, length: int) -> np.ndarray:
+        """
+        Take a free buffer of the given length (contents undefined).
+
+        Args:
+            length: Number of pixels
+
+        Returns:
+            float64 array of the requested length
+        """
+        with self._lock:
+            for i, in_use in enumerate(self._in_use):
+                if not in_use:
+                    if len(self._buffers[i]) != length:
+                        self._buffers[i] = np.empty(length, dtype=np.float64)
+                    self._in_use[i] = True
+                    return self._buffers[i]
+            if len(self._buffers) < self._num_slots:
+                buffer = np.empty(length, dtype=np.float64)
+                self._buffers.append(buffer)
+                self._in_use.append(True)
+                return buffer
+        return np.empty(length, dtype=np.float64)
+
+    def release(self, buffer: Optional[np.ndarray]):
+        """
+        Mark a buffer as free. Buffers not owned by the pool are ignored.
+
+        Args:
+            buffer: Buffer previously returned by acquire()
+        """
+        if buffer is None:
+            return
+        with self._lock:
+            for i, pooled in enumerate(self._buffers):
+                if pooled is buffer:
+                    self._in_use[i] = False
+                    return
+
+
+class LatestResultQueue:
+    """
+    Bounded single-producer/single-consumer result queue that drops the oldest entry.
+
+    The UI only ever needs the freshest spectrum, so when the consumer falls
+    behind the producer replaces the oldest pending result rather than letting
+    the backlog (and display latency) grow.
+
+    Backed by a collections.deque: append() and popleft() are atomic under the
+    GIL, so neither the controller thread nor the UI thread takes a lock. Each
+    entry is popped by exactly one side, so an evicted result is never also
+    delivered. Wake-ups are signalled separately through the frame event.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Initialize the queue.
+
+        Args:
+            maxsize: Maximum number of pending results
+        """
+        assert maxsize > 0, "maxsize must be positive"
+        self.maxsize = maxsize
+        self._items: collections.deque = collections.deque()
+
+    def put_latest(self, item):
+        """
+        Put an item without blocking, evicting the oldest entry if full.
+
+        Only the producer thread may call this.
+
+        Args:
+            item: Result to enqueue
+
+        Returns:
+            The evicted entry, or None if nothing was dropped
+        """
+        items = self._items
+        dropped = None
+        if len(items) >= self.maxsize:
+            try:
+                dropped = items.popleft()
+            except IndexError:
+                pass  # Consumer emptied it in the meantime
+        items.append(item)
+        return dropped
+
+    def get_nowait(self):
+        """
+        Remove and return the oldest pending result.
+
+        Raises:
+            queue.Empty: If no result is pending
+        """
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def qsize(self) -> int:
+        """Return the number of pending results (approximate across threads)."""
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """Return True if no result is pending (approximate across threads)."""
+        return not self._items
 
 
 # ==============================================================================
@@ -145,18 +301,18 @@ class SpectrometerController:
 
     Queue Communication:
         - Commands sent via request_queue
-        - Results sent via result_queue
+        - Results sent via result_queue (a LatestResultQueue, oldest dropped when full)
         - All communication is thread-safe
 
     Example:
         >>> request_queue = queue.Queue()
-        >>> result_queue = queue.Queue()
+        >>> result_queue = LatestResultQueue(maxsize=config.RESULT_QUEUE_MAXSIZE)
         >>> controller = SpectrometerController(shutdown_flag, request_queue, result_queue)
         >>> controller.start()
         >>> # Start capturing
         >>> request_queue.put(SpectrometerCommand(CMD_START_SESSION))
         >>> # Get results
-        >>> result = result_queue.get(timeout=1.0)
+        >>> result = result_queue.get_nowait()
         >>> if result.is_valid:
         >>>     plot(result.wavelengths, result.intensities)
     """
@@ -165,7 +321,8 @@ class SpectrometerController:
         self,
         shutdown_flag: threading.Event,
         request_queue: queue.Queue,
-        result_queue: queue.Queue,
+        result_queue: LatestResultQueue,
+        frame_event: Optional[threading.Event] = None,
     ):
         """
         Initialize the spectrometer controller.
@@ -174,10 +331,12 @@ class SpectrometerController:
             shutdown_flag: Global shutdown event (set to terminate thread)
             request_queue: Queue for receiving commands
             result_queue: Queue for sending results
+            frame_event: Optional event set after each result so the UI wakes immediately
         """
         self.shutdown_flag = shutdown_flag
         self.request_queue = request_queue
         self.result_queue = result_queue
+        self.frame_event = frame_event
 
         # Thread management
         self._thread: Optional[threading.Thread] = None
@@ -205,9 +364,24 @@ class SpectrometerController:
         self._white_reference: Optional[np.ndarray] = None
         self._white_reference_integration_ms: Optional[int] = None
 
+        # Reflectance terms derived from the current references, rebuilt only
+        # when either reference array is replaced
+        self._reflectance_refs: Optional[tuple] = None  # (dark, white) used below
+        self._reflectance_denominator: Optional[np.ndarray] = None  # white - dark
+        self._reflectance_valid: Optional[np.ndarray] = None  # |white - dark| > eps
+        self._reflectance_invalid: Optional[np.ndarray] = None  # ~valid
+
         # Capture type tracking
         self._current_capture_type = config.MODES.SPECTRA_TYPE_RAW
 
+        # Reusable buffers: averaging accumulator (thread-private) and result
+        # intensities (pooled; up to two per result, for every result that can be
+        # queued, held by the UI, or being filled)
+        self._accumulator: Optional[np.ndarray] = None
+        self._buffer_pool = SpectrumBufferPool(
+            num_slots=2 * (config.RESULT_QUEUE_MAXSIZE + 2)
+        )
+
     def start(self):
         """Start the spectrometer controller thread."""
         if self._thread is not None and self._thread.is_alive():
@@ -260,6 +434,7 @@ class SpectrometerController:
         5. Cleans up on shutdown
         """
         print("SpectrometerController: Thread loop started")
+        cpu_affinity.pin_current_thread("SPECTROMETER")
 
         # Initialize hardware with retries for boot timing
         initialized = False
@@ -341,6 +516,8 @@ class SpectrometerController:
                     self.spectrometer.close()
                 self.spectrometer = None
                 return False
+            # Shared by every result without copying, so guard against mutation
+            self.wavelengths.setflags(write=False)
 
             print(f"Spectrometer initialized: {self.spectrometer.model}")
             print(f"  Serial: {self.spectrometer.serial_number}")
@@ -624,7 +801,8 @@ class SpectrometerController:
                 processed_intensities = self._calculate_reflectance(raw_intensities)
                 spectra_type = config.MODES.SPECTRA_TYPE_REFLECTANCE
                 # Store raw intensities for saving alongside reflectance
-                raw_intensities_for_result = raw_intensities.copy()
+                # (reflectance is a separate buffer, so no copy is needed)
+                raw_intensities_for_result = raw_intensities
             else:
                 print(
                     "WARNING: Reflectance mode but references not available. Sending raw data."
@@ -632,7 +810,7 @@ class SpectrometerController:
 
         # Create result
         result = SpectrometerResult(
-            wavelengths=self.wavelengths.copy(),
+            wavelengths=self.wavelengths,
             intensities=processed_intensities,
             timestamp=datetime.datetime.now(),
             integration_time_ms=self._integration_time_ms,
@@ -644,18 +822,15 @@ class SpectrometerController:
                 scan_session_id == self._session_id
             ),  # Valid if session hasn't changed
             raw_intensities=raw_intensities_for_result,  # Raw data for reflectance saves
+            buffer_pool=self._buffer_pool,
         )
 
-        # Send to result queue (non-blocking)
-        try:
-            self.result_queue.put_nowait(result)
-        except queue.Full:
-            print("WARNING: Result queue full. Dropping oldest result.")
-            try:
-                self.result_queue.get_nowait()  # Remove oldest
-                self.result_queue.put_nowait(result)  # Add new
-            except queue.Empty:
-                pass
+        # Send to result queue (non-blocking, replaces the oldest if the UI is behind)
+        dropped = self.result_queue.put_latest(result)
+        if dropped is not None:
+            dropped.release()
+        if self.frame_event is not None:
+            self.frame_event.set()
 
     def _capture_single_scan(self) -> Optional[np.ndarray]:
         """
@@ -707,7 +882,7 @@ class SpectrometerController:
             # No averaging, just capture single scan
             return self._capture_single_scan()
 
-        # Capture multiple scans and average
+        # Capture multiple scans and average into the reusable accumulator
         accumulated = None
         valid_scans = 0
 
@@ -715,9 +890,13 @@ class SpectrometerController:
             intensities = self._capture_single_scan()
             if intensities is not None:
                 if accumulated is None:
-                    accumulated = intensities.astype(np.float64)
+                    accumulated = self._accumulator
+                    if accumulated is None or len(accumulated) != len(intensities):
+                        accumulated = np.empty(len(intensities), dtype=np.float64)
+                        self._accumulator = accumulated
+                    np.copyto(accumulated, intensities)
                 else:
-                    accumulated += intensities.astype(np.float64)
+                    np.add(accumulated, intensities, out=accumulated)
                 valid_scans += 1
             else:
                 print(f"WARNING: Scan {i+1}/{self._scans_to_average} failed")
@@ -725,8 +904,10 @@ class SpectrometerController:
         if valid_scans == 0:
             return None
 
-        # Return average
-        return (accumulated / valid_scans).astype(np.float64)
+        # Return average in a pooled buffer (accumulator is reused next capture)
+        averaged = self._buffer_pool.acquire(len(accumulated))
+        np.divide(accumulated, valid_scans, out=averaged)
+        return averaged
 
     def _calculate_reflectance(self, raw_intensities: np.ndarray) -> np.ndarray:
         """
@@ -745,17 +926,35 @@ class SpectrometerController:
         Returns:
             Reflectance array (clipped to minimum 0.0, no upper bound)
         """
-        numerator = raw_intensities - self._dark_reference
-        denominator = self._white_reference - self._dark_reference
-
-        # Calculate reflectance with division-by-zero protection
-        reflectance = np.full_like(raw_intensities, 0.0, dtype=float)
-        valid_denom = np.abs(denominator) > config.DIVISION_EPSILON
-        reflectance[valid_denom] = numerator[valid_denom] / denominator[valid_denom]
+        dark = self._dark_reference
+        white = self._white_reference
+
+        # White - dark (and its division-by-zero mask) only changes with the
+        # references, so it is computed once per reference pair
+        refs = self._reflectance_refs
+        if refs is None or refs[0] is not dark or refs[1] is not white:
+            denominator = np.subtract(white, dark, dtype=np.float64)
+            valid = np.abs(denominator) > config.DIVISION_EPSILON
+            self._reflectance_denominator = denominator
+            self._reflectance_valid = valid
+            self._reflectance_invalid = ~valid
+            self._reflectance_refs = (dark, white)
+
+        # Fused in one output buffer: (raw - dark) / (white - dark), 0 where the
+        # denominator is ~0, without numerator/mask temporaries
+        reflectance = self._buffer_pool.acquire(len(raw_intensities))
+        np.subtract(raw_intensities, dark, out=reflectance)
+        np.divide(
+            reflectance,
+            self._reflectance_denominator,
+            out=reflectance,
+            where=self._reflectance_valid,
+        )
+        np.copyto(reflectance, 0.0, where=self._reflectance_invalid)
 
         # Only clip negative values (physically impossible)
         # Do NOT clip values > 1.0 as these can be legitimate (fluorescence, etc.)
-        return np.maximum(reflectance, 0.0)
+        return np.maximum(reflectance, 0.0, out=reflectance)
 
     def _capture_for_auto_integration(self, test_integration_us: int):
         """
@@ -800,7 +999,7 @@ class SpectrometerController:
 
             # Create result with auto-integration data
             result = SpectrometerResult(
-                wavelengths=self.wavelengths.copy(),
+                wavelengths=self.wavelengths,
                 intensities=intensities,
                 timestamp=datetime.datetime.now(),
                 integration_time_ms=int(round(clamped_integration_us / 1000.0)),
@@ -815,15 +1014,12 @@ class SpectrometerController:
             )
 
             # Send to result queue
-            try:
-                self.result_queue.put_nowait(result)
-            except queue.Full:
-                print("WARNING: Result queue full during auto-integ. Dropping oldest.")
-                try:
-                    self.result_queue.get_nowait()
-                    self.result_queue.put_nowait(result)
-                except queue.Empty:
-                    pass
+            dropped = self.result_queue.put_latest(result)
+            if dropped is not None:
+                dropped.release()
+                print("WARNING: Result queue full during auto-integ. Dropped oldest.")
+            if self.frame_event is not None:
+                self.frame_event.set()
 
         except Exception as e:
             print(f"ERROR: Exception during auto-integ capture: {e}")
@@ -12,7 +12,8 @@
 #          Fan turns ON when temperature >= threshold. Default threshold is 0C,
 #          meaning the fan runs continuously when the spectrometer starts.
 #
-#          Requires: smbus2 (pip install smbus2)
+#          Requires: smbus2 (pip install smbus2). smbus2 and RPi.GPIO are imported
+#          once at module load; their availability is recorded in module flags.
 
 import sys
 import os
@@ -21,11 +22,60 @@ import time
 import logging
 
 import config
+from hardware import cpu_affinity
+from hardware.i2c_lock import i2c_txn
+
+try:
+    import smbus2
+    from smbus2 import i2c_msg
+
+    SMBUS2_AVAILABLE = True
+except ImportError:
+    SMBUS2_AVAILABLE = False
+
+try:
+    import RPi.GPIO as GPIO
+
+    GPIO_AVAILABLE = True
+except (RuntimeError, ImportError):
+    GPIO_AVAILABLE = False
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
 
+##
+# @class _LoggedOnceFilter
+# @brief Logging filter that drops repeats of the same message within a time window.
+# @details Records are keyed by (levelno, formatted message). A key that was emitted
+#          less than window_s seconds ago is suppressed, so a persistent I2C fault
+#          logs once instead of spamming the console/framebuffer every tick.
+class _LoggedOnceFilter(logging.Filter):
+    """Suppresses duplicate log records within a time window."""
+
+    def __init__(self, window_s=60.0):
+        super().__init__()
+        self._window_s = window_s
+        self._last_seen = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        key = (record.levelno, record.getMessage())
+        now = time.monotonic()
+        with self._lock:
+            # Evict expired entries so the dict stays small
+            expired = [k for k, t in self._last_seen.items() if now - t >= self._window_s]
+            for k in expired:
+                del self._last_seen[k]
+            if key in self._last_seen:
+                return False
+            self._last_seen[key] = now
+        return True
+
+
+logger.addFilter(_LoggedOnceFilter())
+
+
 ##
 # @class TempSensorInfo
 # @brief Manages temperature sensor readings and automatic fan control.
@@ -59,6 +109,10 @@ class TempSensorInfo:
     # @brief After this many consecutive read failures, mark sensor unavailable.
     MAX_CONSECUTIVE_FAILURES = 5
 
+    ## @var REG_AMBIENT_TEMP
+    # @brief MCP9808 ambient temperature register.
+    REG_AMBIENT_TEMP = 0x05
+
     def __init__(self, shutdown_flag):
         assert isinstance(shutdown_flag, threading.Event), "shutdown_flag must be threading.Event"
 
@@ -102,6 +156,14 @@ class TempSensorInfo:
         # @brief I2C bus number (typically 1 on Raspberry Pi).
         self._i2c_bus_num = 1
 
+        ## @var _i2c_write_msg
+        # @brief Preallocated i2c_msg selecting the ambient temperature register.
+        self._i2c_write_msg = None
+
+        ## @var _i2c_read_msg
+        # @brief Preallocated 2-byte i2c_msg reused for every temperature read.
+        self._i2c_read_msg = None
+
         ## @var _gpio_available
         # @brief Boolean indicating if GPIO is available for fan control.
         self._gpio_available = False
@@ -144,9 +206,7 @@ class TempSensorInfo:
             logger.info("Temperature sensor disabled in config.")
             return
 
-        try:
-            import smbus2
-        except ImportError:
+        if not SMBUS2_AVAILABLE:
             logger.warning("smbus2 not available. Install with: pip install smbus2")
             self._sensor = None
             return
@@ -154,13 +214,21 @@ class TempSensorInfo:
         self._i2c_address = getattr(config, "MCP9808_I2C_ADDRESS", 0x18)
         self._i2c_bus_num = getattr(config, "I2C_BUS_NUMBER", 1)
 
+        # Build the register-select and read messages once; every tick reuses
+        # them so no per-read lists are allocated
+        self._i2c_write_msg = i2c_msg.write(self._i2c_address, [self.REG_AMBIENT_TEMP])
+        self._i2c_read_msg = i2c_msg.read(self._i2c_address, 2)
+
         for attempt in range(self.INIT_RETRY_COUNT):
             if self._shutdown_flag.is_set():
                 return
 
             if attempt > 0:
                 print(f"MCP9808: Retry {attempt + 1}/{self.INIT_RETRY_COUNT}...")
-                time.sleep(self.INIT_RETRY_DELAY_S)
+                # Interruptible delay so shutdown is not held up by boot retries
+                if self._shutdown_flag.wait(timeout=self.INIT_RETRY_DELAY_S):
+                    self._close_i2c_bus()
+                    return
 
             try:
                 # Open I2C bus (close previous attempt if any)
@@ -177,11 +245,12 @@ class TempSensorInfo:
                 REG_MANUF_ID = 0x06
                 REG_DEVICE_ID = 0x07
 
-                data = self._i2c_bus.read_i2c_block_data(self._i2c_address, REG_MANUF_ID, 2)
-                manuf_id = (data[0] << 8) | data[1]
+                with i2c_txn(self._i2c_bus) as bus:
+                    data = bus.read_i2c_block_data(self._i2c_address, REG_MANUF_ID, 2)
+                    manuf_id = (data[0] << 8) | data[1]
 
-                data = self._i2c_bus.read_i2c_block_data(self._i2c_address, REG_DEVICE_ID, 2)
-                device_id = (data[0] << 8) | data[1]
+                    data = bus.read_i2c_block_data(self._i2c_address, REG_DEVICE_ID, 2)
+                    device_id = (data[0] << 8) | data[1]
 
                 if manuf_id == 0x0054 and device_id == 0x0400:
                     initial_temp = self._read_temperature_raw()
@@ -238,9 +307,12 @@ class TempSensorInfo:
     #          Fan will be turned on during the first update cycle if threshold is met.
     def _init_gpio(self):
         """Initializes GPIO for fan control."""
-        try:
-            import RPi.GPIO as GPIO
+        if not GPIO_AVAILABLE:
+            logger.warning("RPi.GPIO not available. Fan control disabled.")
+            self._gpio_available = False
+            return
 
+        try:
             self._GPIO = GPIO
             self._GPIO.setmode(GPIO.BCM)
             self._GPIO.setwarnings(False)
@@ -250,9 +322,6 @@ class TempSensorInfo:
             self._gpio_available = True
             logger.info(f"GPIO initialized for fan control on pin {config.FAN_ENABLE_PIN}")
 
-        except ImportError:
-            logger.warning("RPi.GPIO not available. Fan control disabled.")
-            self._gpio_available = False
         except Exception as e:
             logger.error(f"Failed to initialize GPIO for fan: {e}")
             self._gpio_available = False
@@ -315,6 +384,10 @@ class TempSensorInfo:
         """
         logger.info("Temperature update loop started.")
 
+        cpu_affinity.pin_current_thread("BACKGROUND")
+        if getattr(config, "TEMP_THREAD_LOW_PRIO", False):
+            self._lower_thread_priority()
+
         while not self._shutdown_flag.is_set():
             start_time = time.monotonic()
 
@@ -324,8 +397,11 @@ class TempSensorInfo:
             else:
                 current_temp = self._read_temperature()
 
+            # Evaluated once per tick; a failed read never becomes numeric below
+            is_numeric = isinstance(current_temp, (float, int))
+
             # Track consecutive failures
-            if isinstance(current_temp, (float, int)):
+            if is_numeric:
                 self._consecutive_failures = 0
                 self._last_good_temp = current_temp
             elif self._sensor is not None and not self._sensor_gave_up:
@@ -342,7 +418,7 @@ class TempSensorInfo:
                 self._temperature_c = current_temp
 
                 # Control fan based on threshold
-                if isinstance(current_temp, (float, int)):
+                if is_numeric:
                     should_fan_be_on = current_temp >= self._fan_threshold_c
                 else:
                     # If temp reading failed, use current fan state (don't change)
@@ -358,6 +434,25 @@ class TempSensorInfo:
 
         logger.info("Temperature update loop finished.")
 
+    ##
+    # @brief Demotes the calling thread to idle scheduling priority.
+    # @details Temperature sampling is not latency critical, so the update thread
+    #          yields the CPU to the spectrometer and UI threads. On Linux both
+    #          sched_setscheduler(0, ...) and nice() act on the calling thread only.
+    #          Falls back to nice(10) if SCHED_IDLE is unavailable, and silently
+    #          keeps normal priority if neither is permitted.
+    def _lower_thread_priority(self):
+        """Lowers the scheduling priority of the current (update) thread."""
+        try:
+            os.sched_setscheduler(0, os.SCHED_IDLE, os.sched_param(0))
+            logger.debug("Temperature update thread set to SCHED_IDLE.")
+        except (AttributeError, OSError):
+            try:
+                os.nice(10)
+                logger.debug("Temperature update thread niceness raised by 10.")
+            except (AttributeError, OSError):
+                pass
+
     ##
     # @brief Reads temperature directly from MCP9808 via I2C.
     # @return Temperature in Celsius (float) or error string if read fails.
@@ -365,18 +460,18 @@ class TempSensorInfo:
     def _read_temperature_raw(self):
         """Reads temperature directly from MCP9808 via I2C.
 
-        Only logs the first failure in a series of consecutive failures
-        to prevent error messages from spamming the console/framebuffer.
+        Repeated failure messages are de-duplicated by the module's
+        _LoggedOnceFilter to prevent spamming the console/framebuffer.
         """
         if self._i2c_bus is None:
             return "No Bus"
 
         try:
-            # MCP9808 ambient temperature register
-            REG_AMBIENT_TEMP = 0x05
-
-            # Read 2 bytes from temperature register
-            data = self._i2c_bus.read_i2c_block_data(self._i2c_address, REG_AMBIENT_TEMP, 2)
+            # Select ambient temperature register and read 2 bytes into the
+            # preallocated message buffer (repeated start, single transaction)
+            with i2c_txn(self._i2c_bus) as bus:
+                bus.i2c_rdwr(self._i2c_write_msg, self._i2c_read_msg)
+                data = bytes(self._i2c_read_msg)
             raw_temp = (data[0] << 8) | data[1]
 
             # Convert to Celsius (MCP9808 format)
@@ -389,16 +484,13 @@ class TempSensorInfo:
             return temp_c
 
         except OSError as e:
-            # Only log the first failure to avoid spamming the framebuffer console
-            if self._consecutive_failures == 0:
-                if e.errno == 121:
-                    print("MCP9808: I2C read failed (remote I/O error)")
-                else:
-                    print(f"MCP9808: I2C read failed: {e}")
+            if e.errno == 121:
+                logger.warning("MCP9808: I2C read failed (remote I/O error)")
+            else:
+                logger.warning(f"MCP9808: I2C read failed: {e}")
             return "I2C Error"
         except Exception as e:
-            if self._consecutive_failures == 0:
-                print(f"MCP9808: Read failed: {e}")
+            logger.warning(f"MCP9808: Read failed: {e}")
             return "Read Error"
 
     ##
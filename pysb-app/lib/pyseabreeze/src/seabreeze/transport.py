@@ -6,24 +6,32 @@ Some spectrometers can support different transports (usb, network, rs232, etc.)
 
 from __future__ import annotations
 
+import array
 import importlib
 import inspect
 import ipaddress
 import logging
+import os
+import selectors
 import socket
 import struct
+import time
 import warnings
 import weakref
 from collections.abc import Iterable
-from functools import partialmethod
 from typing import TYPE_CHECKING
 from typing import Any
-from typing import Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional, Union
 
 import usb.backend
 import usb.core
 import usb.util
 
+try:
+    import fcntl
+except ImportError:  # not available on windows
+    fcntl = None  # type: ignore
+
 from seabreeze.pyseabreeze.protocol import OBPProtocol
 from seabreeze.pyseabreeze.types import PySeaBreezeProtocol
 from seabreeze.pyseabreeze.types import PySeaBreezeTransport
@@ -50,7 +58,11 @@ class USBTransportDeviceInUse(Exception):
     pass
 
 
-DeviceIdentity = Tuple[int, int, int, int]
+# (vendor_id, product_id, bus, address) for usb, (ip_address, port, 0, 0) for ipv4
+DeviceIdentity = Tuple[Union[int, str], int, int, int]
+
+# not available on every platform
+_MSG_WAITALL = getattr(socket, "MSG_WAITALL", 0)
 
 
 # this can and should be opaque to pyseabreeze
@@ -72,6 +84,42 @@ class USBTransportHandle:
         )
         self.pyusb_backend = get_name_from_pyusb_backend(pyusb_device.backend)
         self._interface_claimed = False
+        self._lock_fd: int | None = None
+
+    def acquire_open_lock(self) -> bool:
+        """Take a per-device advisory lock shared by all processes.
+
+        The lock is held while the device is open, so a second process trying
+        to open the same spectrometer fails fast instead of running into the
+        "interface 0 claimed" path. The kernel drops the lock if the process
+        dies. Returns False if another process holds it; returns True if the
+        lock was taken or locking is unavailable on this platform.
+        """
+        if fcntl is None or self._lock_fd is not None:
+            return True
+        vid, pid, bus, address = self.identity
+        lock_path = f"/tmp/seabreeze-{vid:04x}{pid:04x}-{bus}-{address}.lock"
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o600)
+        except OSError as err:
+            logging.debug(f"Could not create device lock file {lock_path}: {err}")
+            return True
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._lock_fd = fd
+        return True
+
+    def release_open_lock(self) -> None:
+        """Release the lock taken by acquire_open_lock (if any)."""
+        if self._lock_fd is not None:
+            fd, self._lock_fd = self._lock_fd, None
+            try:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
 
     def close(self) -> None:
         """Close the USB device handle properly.
@@ -102,6 +150,8 @@ class USBTransportHandle:
         except Exception:
             # Catch any other errors during cleanup
             pass
+        # allow other processes to open the device again
+        self.release_open_lock()
 
     def __del__(self) -> None:
         if self.pyusb_backend == "libusb1":
@@ -128,6 +178,14 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
     )
     vendor_product_ids: Dict[Tuple[int, int], str] = {}
 
+    # post-open settle time in ms for models that need it, keyed by (vid, pid).
+    # The Ocean ST needs time to wake up its OBP2 parser after configuration;
+    # without it, the first command (typically serial number query) times out
+    # with Errno 110. Models not listed here don't wait.
+    _open_stabilization_ms: Dict[Tuple[int, int], float] = {
+        (0x0999, 0x1000): 500.0,  # Ocean ST
+    }
+
     # add logging
     _log = logging.getLogger(__name__)
 
@@ -159,10 +217,17 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
         else:
             self._default_read_endpoint = "high_speed"
         self._default_read_spectrum_endpoint = "high_speed"
+        # reusable receive buffers keyed by read size
+        self._rx_buffers: Dict[int, array.array] = {}
         # internal state
         self._device: USBTransportHandle | None = None
         self._opened: bool | None = None
         self._protocol: PySeaBreezeProtocol | None = None
+        # hot path bindings, populated in open_device
+        self._ep_out: int | None = None
+        self._read_ep: Dict[str, int | None] = {}
+        self._pyusb_write: Any = None
+        self._pyusb_read: Any = None
 
     def _clear_stale_claims_sysfs(self, pyusb_device: usb.core.Device) -> bool:
         """Clear stale USB claims using sysfs unbind/rebind (Jetson Orin safe).
@@ -181,29 +246,33 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
         """
         import os
         import time
-        import glob
 
         try:
             bus = pyusb_device.bus
             address = pyusb_device.address
 
             # Find the sysfs path for this device
-            # USB devices are at /sys/bus/usb/devices/X-Y.Z where X is bus
-            sysfs_pattern = f"/sys/bus/usb/devices/{bus}-*"
+            # USB devices are at /sys/bus/usb/devices/X-Y.Z where X is bus;
+            # interface nodes (X-Y.Z:C.I) have no devnum and are skipped
+            prefix = f"{bus}-"
 
             device_path = None
-            for path in glob.glob(sysfs_pattern):
-                # Check if this path matches our device by reading devnum
-                devnum_path = os.path.join(path, "devnum")
-                if os.path.exists(devnum_path):
+            with os.scandir("/sys/bus/usb/devices") as entries:
+                for entry in entries:
+                    if not entry.name.startswith(prefix) or ":" in entry.name:
+                        continue
+                    # Check if this path matches our device by reading devnum
                     try:
-                        with open(devnum_path, 'r') as f:
-                            devnum = int(f.read().strip())
-                            if devnum == address:
-                                device_path = os.path.basename(path)
-                                break
-                    except (IOError, ValueError):
+                        fd = os.open(entry.path + "/devnum", os.O_RDONLY)
+                        try:
+                            devnum = int(os.read(fd, 16).strip())
+                        finally:
+                            os.close(fd)
+                    except (OSError, ValueError):
                         continue
+                    if devnum == address:
+                        device_path = entry.name
+                        break
 
             if not device_path:
                 self._log.debug(f"Could not find sysfs path for bus={bus} addr={address}")
@@ -249,6 +318,66 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
             self._log.debug(f"Sysfs claim clearing failed: {e}")
             return False
 
+    def _enable_auto_detach_kernel_driver(self, pyusb_device: usb.core.Device) -> bool:
+        """Ask libusb1 to detach kernel drivers automatically on claim.
+
+        Returns True if auto-detach is active, False if it is unsupported
+        (other pyusb backends, or platforms where libusb reports
+        LIBUSB_ERROR_NOT_SUPPORTED) and the caller should detach manually.
+        """
+        if self._device is None or self._device.pyusb_backend != "libusb1":
+            return False
+        lib = getattr(pyusb_device.backend, "lib", None)
+        set_auto_detach = getattr(lib, "libusb_set_auto_detach_kernel_driver", None)
+        if set_auto_detach is None:
+            return False
+        try:
+            # noinspection PyProtectedMember
+            handle = pyusb_device._ctx.managed_open()
+            ret = set_auto_detach(handle.handle, 1)
+        except Exception as err:
+            self._log.debug(f"Kernel driver auto-detach unavailable: {err}")
+            return False
+        if ret != 0:
+            self._log.debug(f"Kernel driver auto-detach not supported (libusb {ret})")
+            return False
+        self._log.debug("Enabled kernel driver auto-detach")
+        return True
+
+    def _make_bulk_writer(
+        self, pyusb_device: usb.core.Device, endpoint: int
+    ) -> Any:
+        """Return a drop-in for ``pyusb_device.write`` bound to the backend.
+
+        usb.core.Device.write resolves the interface, endpoint type and buffer
+        on every call. For the (bulk) OUT endpoint these never change once the
+        interface is claimed, so resolve them once and call the backend's
+        bulk_write directly. Returns None if the pyusb internals don't have the
+        expected shape; the caller then keeps using ``pyusb_device.write``.
+        """
+        try:
+            # noinspection PyProtectedMember
+            ctx = pyusb_device._ctx
+            intf, ep = ctx.setup_request(pyusb_device, endpoint)
+            if usb.util.endpoint_type(ep.bmAttributes) != usb.util.ENDPOINT_TYPE_BULK:
+                return None
+            bulk_write = ctx.backend.bulk_write
+            dev_handle = ctx.handle
+            ep_address = ep.bEndpointAddress
+            intf_number = intf.bInterfaceNumber
+        except Exception as err:
+            self._log.debug(f"Using pyusb write path: {err}")
+            return None
+
+        def write(_endpoint: int, data: bytes, timeout: int | None = None) -> int:
+            if timeout is None:
+                timeout = pyusb_device.default_timeout
+            return bulk_write(  # type: ignore
+                dev_handle, ep_address, intf_number, array.array("B", data), timeout
+            )
+
+        return write
+
     def open_device(self, device: USBTransportHandle) -> None:
         if not isinstance(device, USBTransportHandle):
             raise TypeError("device needs to be a USBTransportHandle")
@@ -256,6 +385,13 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
         pyusb_device = self._device.pyusb_device
         import time
 
+        # === STEP 0: Serialize opens of this device across processes ===
+        if not self._device.acquire_open_lock():
+            raise USBTransportDeviceInUse(
+                "Device is opened by another process. "
+                "Close the other python/seabreeze process first."
+            )
+
         # === STEP 1: Clear internal pyusb/libusb state ===
         # This frees any stale handles without bouncing the USB bus
         try:
@@ -264,25 +400,32 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
             pass
 
         # === STEP 2: Detach kernel driver (required for user-space access) ===
-        try:
-            if pyusb_device.is_kernel_driver_active(0):
-                self._log.debug("Detaching kernel driver from interface 0")
-                pyusb_device.detach_kernel_driver(0)
-        except NotImplementedError:
-            pass  # unavailable on some systems/backends
-        except usb.core.USBError as err:
-            self._log.debug(f"Kernel driver detach failed (may be OK): {err}")
+        # On libusb1 let the library detach the driver as part of claiming the
+        # interface; otherwise fall back to the explicit query + detach.
+        if not self._enable_auto_detach_kernel_driver(pyusb_device):
+            try:
+                if pyusb_device.is_kernel_driver_active(0):
+                    self._log.debug("Detaching kernel driver from interface 0")
+                    pyusb_device.detach_kernel_driver(0)
+            except NotImplementedError:
+                pass  # unavailable on some systems/backends
+            except usb.core.USBError as err:
+                self._log.debug(f"Kernel driver detach failed (may be OK): {err}")
 
         # === STEP 3: Set configuration (only if necessary) ===
         # On Jetson Orin, calling set_configuration while interface is already
         # claimed causes the "interface 0 claimed" dmesg error and USB hangs.
         # We only call it if the device isn't already configured to config 1.
+        # The active configuration is fetched once and reused below; it is only
+        # re-queried if set_configuration had to run.
+        cfg = None
         try:
             # First, check if configuration is already set to 1
             # Most Linux systems do this automatically on plug
             cfg = pyusb_device.get_active_configuration()
             if cfg.bConfigurationValue != 1:
                 self._log.debug("Device not configured to 1, setting configuration...")
+                cfg = None
                 pyusb_device.set_configuration(1)
             else:
                 self._log.debug("Device already configured to config 1, skipping set_configuration")
@@ -301,6 +444,7 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
             self._log.debug("Successfully claimed USB interface 0")
         except usb.core.USBError as claim_err:
             self._log.error(f"Claim failed: {claim_err}")
+            self._device.release_open_lock()
             raise USBTransportDeviceInUse(
                 f"Interface 0 is locked: {claim_err}. "
                 "Try: 1) Kill any other python/seabreeze processes, 2) Unplug and replug the device"
@@ -308,11 +452,35 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
 
         self._opened = True
 
+        # Resolve endpoints and bind the pyusb I/O methods once, so that
+        # write() and read() avoid repeated attribute lookups per transfer
+        self._ep_out = self._endpoint_map.ep_out
+        self._read_ep = {
+            mode_name: getattr(self._endpoint_map, endpoint_map_name)
+            for mode_name, endpoint_map_name in self._read_endpoints.items()
+        }
+        self._pyusb_write = (
+            self._make_bulk_writer(pyusb_device, self._ep_out) or pyusb_device.write
+        )
+        self._pyusb_read = pyusb_device.read
+
         # Configure the default_read_size according to pyusb info
+        # only look up the endpoints that are actually used for reading
+        needed_endpoints = {
+            ep_int
+            for ep_int in (
+                getattr(self._endpoint_map, name, None)
+                for name in self._read_endpoints.values()
+            )
+            if ep_int is not None
+        }
+        if cfg is None:
+            cfg = pyusb_device.get_active_configuration()
         ep_max_packet_size = {}
-        for intf in pyusb_device.get_active_configuration():
+        for intf in cfg:
             for ep in intf.endpoints():
-                ep_max_packet_size[ep.bEndpointAddress] = ep.wMaxPacketSize
+                if ep.bEndpointAddress in needed_endpoints:
+                    ep_max_packet_size[ep.bEndpointAddress] = ep.wMaxPacketSize
 
         for mode_name, endpoint_map_name in self._read_endpoints.items():
             ep_int = getattr(self._endpoint_map, endpoint_map_name, None)
@@ -334,12 +502,13 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
         except Exception as err:
             self._log.debug(f"Could not set default timeout: {err}")
 
-        # === STEP 6: Stabilization delay (critical for Ocean ST) ===
-        # The Ocean ST needs time to wake up its OBP2 parser after configuration.
-        # Without this delay, the first command (typically serial number query)
-        # times out with Errno 110.
-        time.sleep(0.5)
-        self._log.debug("Device stabilization delay complete (500ms)")
+        # === STEP 6: Stabilization delay (model specific, critical for Ocean ST) ===
+        delay_ms = self._open_stabilization_ms.get(
+            (self._vendor_id, self._product_id), 0.0
+        )
+        if delay_ms:
+            time.sleep(delay_ms / 1000.0)
+            self._log.debug(f"Device stabilization delay complete ({delay_ms:.0f}ms)")
 
         # This will initialize the communication protocol
         if self._opened:
@@ -350,29 +519,23 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
         return self._opened or False
 
     def close_device(self) -> None:
-        # Release interface before closing
-        if self._device is not None and hasattr(self._device, '_interface_claimed'):
-            if self._device._interface_claimed:
-                try:
-                    usb.util.release_interface(self._device.pyusb_device, 0)
-                    self._device._interface_claimed = False
-                except usb.core.USBError:
-                    pass
-
+        # USBTransportHandle.close releases the claimed interface before
+        # disposing resources, so it is the single place the release happens
         if self._device is not None:
             self._device.close()
             self._device = None
+        self._pyusb_write = None
+        self._pyusb_read = None
         self._opened = False
         self._protocol = None
 
     def write(self, data: bytes, timeout_ms: int | None = None, **kwargs: Any) -> int:
-        if self._device is None:
+        pyusb_write = self._pyusb_write
+        if pyusb_write is None:
             raise RuntimeError("device not opened")
         if kwargs:
             warnings.warn(f"kwargs provided but ignored: {kwargs}")
-        return self._device.pyusb_device.write(  # type: ignore
-            self._endpoint_map.ep_out, data, timeout=timeout_ms
-        )
+        return pyusb_write(self._ep_out, data, timeout=timeout_ms)  # type: ignore
 
     def read(
         self,
@@ -381,17 +544,23 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
         mode: str | None = None,
         **kwargs: Any,
     ) -> bytes:
-        if self._device is None:
+        pyusb_read = self._pyusb_read
+        if pyusb_read is None:
             raise RuntimeError("device not opened")
-        mode = mode if mode is not None else self._default_read_endpoint
-        endpoint = getattr(self._endpoint_map, self._read_endpoints[mode])
+        if mode is None:
+            mode = self._default_read_endpoint
+        endpoint = self._read_ep[mode]
         if size is None:
             size = self._default_read_size[mode]
         if kwargs:
             warnings.warn(f"kwargs provided but ignored: {kwargs}")
-        ret: bytes = self._device.pyusb_device.read(
-            endpoint, size, timeout=timeout_ms
-        ).tobytes()
+        # read into a preallocated buffer so pyusb doesn't allocate a new
+        # array per transfer; the only copy left is the returned bytes object
+        buf = self._rx_buffers.get(size)
+        if buf is None:
+            buf = self._rx_buffers[size] = array.array("B", bytes(size))
+        nbytes = pyusb_read(endpoint, buf, timeout=timeout_ms)
+        ret: bytes = memoryview(buf)[:nbytes].tobytes()
         return ret
 
     @property
@@ -439,13 +608,17 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
         """
         # check if a specific pyusb backend is requested
         _pyusb_backend = kwargs.get("pyusb_backend", None)
+        # snapshot the registry once so the match callback is a single set lookup
+        supported_ids = frozenset(cls.vendor_product_ids)
+
+        def _is_supported(dev: usb.core.Device) -> bool:
+            return (dev.idVendor, dev.idProduct) in supported_ids
+
         # get all matching devices
         try:
             pyusb_devices = usb.core.find(
                 find_all=True,
-                custom_match=lambda dev: (
-                    (dev.idVendor, dev.idProduct) in cls.vendor_product_ids
-                ),
+                custom_match=_is_supported,
                 backend=get_pyusb_backend_from_name(name=_pyusb_backend),
             )
         except usb.core.NoBackendError:
@@ -488,10 +661,23 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
         assert set(kwargs) == set(cls._required_init_kwargs)
         # usb transport register automatically on registration
         cls.register_model(model_name, **kwargs)
+        # bind the model settings in a closure so instantiation is a single
+        # positional call instead of going through partialmethod
+        base_init = cls.__init__
+        usb_vendor_id = kwargs["usb_vendor_id"]
+        usb_product_id = kwargs["usb_product_id"]
+        usb_endpoint_map = kwargs["usb_endpoint_map"]
+        usb_protocol = kwargs["usb_protocol"]
+
+        def __init__(self: USBTransport) -> None:
+            base_init(
+                self, usb_vendor_id, usb_product_id, usb_endpoint_map, usb_protocol
+            )
+
         specialized_class = type(
             f"USBTransport{model_name}",
             (cls,),
-            {"__init__": partialmethod(cls.__init__, **kwargs)},
+            {"__init__": __init__},
         )
         return specialized_class
 
@@ -518,6 +704,24 @@ class USBTransport(PySeaBreezeTransport[USBTransportHandle]):
 _pyusb_backend_instances: Dict[str, usb.backend.IBackend] = {}
 
 
+def _preload_pyusb_backends() -> None:
+    """internal: import the known pyusb backends once at module load
+
+    Importing lazily from get_pyusb_backend_from_name takes the import lock
+    on the enumeration path, which can stall (or deadlock) when devices are
+    listed from a worker thread while the main thread is still importing.
+    """
+    for name in ("libusb1", "libusb0", "openusb"):
+        try:
+            m = importlib.import_module(f"usb.backend.{name}")
+            # noinspection PyUnresolvedReferences
+            backend = m.get_backend()
+        except ImportError:
+            continue
+        if backend is not None:
+            _pyusb_backend_instances[name] = backend
+
+
 def get_pyusb_backend_from_name(name: str) -> usb.backend.IBackend:
     """internal: allow requesting a specific pyusb backend for testing"""
     if name is None:
@@ -540,12 +744,25 @@ def get_pyusb_backend_from_name(name: str) -> usb.backend.IBackend:
     return _backend
 
 
+_preload_pyusb_backends()
+
+
+_pyusb_backend_names: Dict[type, Optional[str]] = {}
+
+
 def get_name_from_pyusb_backend(backend: usb.backend.IBackend) -> str | None:
     """internal: return backend name from loaded backend"""
+    # the name only depends on the module defining the backend class, so
+    # resolve it once per backend type instead of once per enumerated device
+    backend_type = type(backend)
+    try:
+        return _pyusb_backend_names[backend_type]
+    except KeyError:
+        pass
     module = inspect.getmodule(backend)
-    if not module:
-        return None
-    return module.__name__.split(".")[-1]
+    name = module.__name__.split(".")[-1] if module else None
+    _pyusb_backend_names[backend_type] = name
+    return name
 
 
 #  ___ ____        _  _
@@ -565,14 +782,18 @@ class IPv4TransportHandle:
 
         """
         self.socket: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # keep the address as a (normalized) dotted string; inet_aton/inet_ntoa
+        # are C calls, so no ipaddress objects are built here or in get_address
         self.identity: DeviceIdentity = (
-            int(ipaddress.IPv4Address(address)),
+            socket.inet_ntoa(socket.inet_aton(address)),
             port,
             0,
             0,
         )
         # register callback to close socket on garbage collection
         self._finalizer = weakref.finalize(self, self.socket.close)
+        # no need to walk these at interpreter exit, the OS reclaims the fds
+        self._finalizer.atexit = False
 
     def open(self) -> None:
         # create a new socket; if we closed it, it will have lost its file descriptor
@@ -593,7 +814,7 @@ class IPv4TransportHandle:
         """Return a touple consisting of the ip address and the port."""
         return (
             # IP address
-            (str(ipaddress.IPv4Address(self.identity[0]))),
+            self.identity[0],  # type: ignore
             # port
             self.identity[1],
         )
@@ -619,12 +840,15 @@ class IPv4Transport(PySeaBreezeTransport[IPv4TransportHandle]):
         self._device: IPv4TransportHandle | None = None
         self._opened: bool | None = None
         self._protocol: PySeaBreezeProtocol | None = None
+        # timeout last applied to the device socket (None: socket default)
+        self._socket_timeout_ms: int | None = None
 
     def open_device(self, device: IPv4TransportHandle) -> None:
         if not isinstance(device, IPv4TransportHandle):
             raise TypeError("device needs to be an IPv4TransportHandle")
         self._device = device
         self._device.open()
+        self._socket_timeout_ms = None
         self._opened = True
 
         # This will initialize the communication protocol
@@ -639,17 +863,24 @@ class IPv4Transport(PySeaBreezeTransport[IPv4TransportHandle]):
         if self._device is not None:
             self._device.close()
             self._device = None
+        self._socket_timeout_ms = None
         self._opened = False
         self._protocol = None
 
+    def _apply_timeout(self, sock: socket.socket, timeout_ms: int | None) -> None:
+        """set the socket timeout, skipping the syscall if it is unchanged"""
+        if timeout_ms and timeout_ms != self._socket_timeout_ms:
+            sock.settimeout(timeout_ms / 1000.0)
+            self._socket_timeout_ms = timeout_ms
+
     def write(self, data: bytes, timeout_ms: int | None = None, **kwargs: Any) -> int:
         if self._device is None:
             raise RuntimeError("device not opened")
         if kwargs:
             warnings.warn(f"kwargs provided but ignored: {kwargs}")
-        if timeout_ms:
-            self._device.socket.settimeout(timeout_ms / 1000.0)
-        return self._device.socket.send(data)
+        sock = self._device.socket
+        self._apply_timeout(sock, timeout_ms)
+        return sock.send(data)
 
     def read(
         self,
@@ -665,13 +896,18 @@ class IPv4Transport(PySeaBreezeTransport[IPv4TransportHandle]):
             size = 64
         if kwargs:
             warnings.warn(f"kwargs provided but ignored: {kwargs}")
-        if timeout_ms:
-            self._device.socket.settimeout(timeout_ms / 1000.0)
+        sock = self._device.socket
+        self._apply_timeout(sock, timeout_ms)
         data = bytearray(size)
-        toread = size
         view = memoryview(data)
+        # ask the kernel to fill the whole buffer in one call; this can still
+        # return short (timeout mode uses a non-blocking fd, or a signal
+        # arrived), so any remainder is read in a loop
+        nbytes = sock.recv_into(view, size, _MSG_WAITALL)
+        view = view[nbytes:]
+        toread = size - nbytes
         while toread:
-            nbytes = self._device.socket.recv_into(view, toread)
+            nbytes = sock.recv_into(view, toread)
             view = view[nbytes:]
             toread -= nbytes
         return bytes(data)
@@ -715,16 +951,16 @@ class IPv4Transport(PySeaBreezeTransport[IPv4TransportHandle]):
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         # allow other sockets to bind this port too
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        # Set a timeout so the socket does not block
-        # indefinitely when trying to receive data.
-        sock.settimeout(kwargs.get("multicast_timeout", 1))
+        # Responses are collected until an absolute deadline; the socket is
+        # non-blocking and driven by a selector so bursts are drained at once.
+        multicast_timeout = kwargs.get("multicast_timeout", 1)
+        sock.setblocking(False)
         sock.setsockopt(
             socket.IPPROTO_IP,
             socket.IP_MULTICAST_IF,
             socket.inet_aton(network_adapter) if network_adapter else socket.INADDR_ANY,
         )
-        mreq = struct.pack(
-            "4sl" if not network_adapter else "4s4s",
+        mreq = (_MREQ_IF_STRUCT if network_adapter else _MREQ_ANY_STRUCT).pack(
             socket.inet_aton(multicast_group),
             (
                 socket.INADDR_ANY
@@ -733,39 +969,40 @@ class IPv4Transport(PySeaBreezeTransport[IPv4TransportHandle]):
             ),
         )
         sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
-        # prepare a message requesting all devices in the multicast group
-        # to send their (USB) product id
-        transport = IPv4Transport(OBPProtocol)
-        protocol = OBPProtocol(transport)
-        msg_type = 0xE01  # Product ID
-        data = protocol.msgs[msg_type]()
-        message = protocol._construct_outgoing_message(
-            msg_type,
-            data,
-            request_ack=True,
-        )
-        sock.sendto(message, (multicast_group, multicast_port))
-        while True:
-            try:
-                data = bytearray(90)
-                nbytes, server = sock.recvfrom_into(data)
-            except socket.timeout:
-                break
-            else:
-                pid_raw = protocol._extract_message_data(data[:nbytes])
-                pid = int(struct.unpack("<H", pid_raw)[0])
-                # use known product ids of the USB transport to look up the model name
-                vid = 0x2457  # Ocean vendor ID
-                model = USBTransport.vendor_product_ids[(vid, pid)]
-                try:
-                    cls.register_model(
-                        model_name=model,
-                        ipv4_address=server[0],
-                        ipv4_port=server[1],
-                    )
-                except ValueError:
-                    # device already known
-                    pass
+        protocol = _DISCOVERY_PROTOCOL
+        # request all devices in the multicast group to send their (USB) product id
+        sock.sendto(_DISCOVER_PID_MESSAGE, (multicast_group, multicast_port))
+        # responses are received into a single reusable buffer
+        data = bytearray(90)
+        view = memoryview(data)
+        deadline = time.monotonic() + multicast_timeout
+        with selectors.DefaultSelector() as selector:
+            selector.register(sock, selectors.EVENT_READ)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    break
+                # drain all datagrams that are currently queued
+                while True:
+                    try:
+                        nbytes, server = sock.recvfrom_into(data)
+                    except BlockingIOError:
+                        break
+                    pid_raw = protocol._extract_message_data(view[:nbytes])
+                    pid = _PID_STRUCT.unpack_from(pid_raw)[0]
+                    # use known product ids of the USB transport to look up the model name
+                    vid = 0x2457  # Ocean vendor ID
+                    model = USBTransport.vendor_product_ids[(vid, pid)]
+                    try:
+                        cls.register_model(
+                            model_name=model,
+                            ipv4_address=server[0],
+                            ipv4_port=server[1],
+                        )
+                    except ValueError:
+                        # device already known
+                        pass
+        sock.close()
 
         # connect to discovered and registered devices
         for address in cls.devices_ip_port:
@@ -805,10 +1042,17 @@ class IPv4Transport(PySeaBreezeTransport[IPv4TransportHandle]):
         assert set(kwargs) == set(cls._required_init_kwargs)
         # ipv4 transport register automatically on registration
         # cls.register_model(model_name, **kwargs)
+        # bind the model settings in a closure (same as USBTransport.specialize)
+        base_init = cls.__init__
+        ipv4_protocol = kwargs["ipv4_protocol"]
+
+        def __init__(self: IPv4Transport) -> None:
+            base_init(self, ipv4_protocol)
+
         specialized_class = type(
             f"IPv4Transport{model_name}",
             (cls,),
-            {"__init__": partialmethod(cls.__init__, **kwargs)},
+            {"__init__": __init__},
         )
         return specialized_class
 
@@ -819,3 +1063,21 @@ class IPv4Transport(PySeaBreezeTransport[IPv4TransportHandle]):
     @classmethod
     def shutdown(cls, **_kwargs: Any) -> None:
         pass
+
+
+# OBP framing for multicast discovery is stateless, so a single protocol
+# instance (kept alive with its transport) encodes the request and decodes
+# the responses for every list_devices call
+_discovery_transport = IPv4Transport(OBPProtocol)
+_DISCOVERY_PROTOCOL = OBPProtocol(_discovery_transport)
+# prebuilt OBP message requesting the (USB) product id from all devices
+# in a multicast group, and the matching decoder for their responses
+_DISCOVER_PID_MESSAGE = _DISCOVERY_PROTOCOL._construct_outgoing_message(
+    0xE01,  # GET_PID
+    OBPProtocol.msgs[0xE01](),
+    request_ack=True,
+)
+_PID_STRUCT = struct.Struct("<H")
+# ip_mreq layouts for joining a multicast group on any / a specific interface
+_MREQ_ANY_STRUCT = struct.Struct("4sl")
+_MREQ_IF_STRUCT = struct.Struct("4s4s")
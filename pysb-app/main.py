@@ -11,11 +11,14 @@
 #
 #  @details The application uses a multi-threaded architecture with
 #  queue-based communication between components. The main loop runs
-#  at ~30 FPS and handles state transitions based on user input.
+#  at ~30 FPS (or sooner when a new spectrum arrives) and handles state
+#  transitions based on user input.
 #
 #  Global Events:
 #  - shutdown_flag: Signals all threads to terminate gracefully
 #  - leak_detected_flag: Set by LeakSensor when leak is detected
+#  - frame_event: Set when a new result is queued, a GPIO button is pressed
+#    or a leak is detected, waking the main loop before its next frame slot
 #
 #  State Machine:
 #  - MENU: Main menu for settings and navigation
@@ -26,12 +29,14 @@ from dataclasses import dataclass
 import queue
 import time
 import os
+import signal
 import pygame
 
 # Local imports
 import config
 from hardware import button_handler, leak_sensor, network_info, spectrometer_controller
 from hardware import temp_sensor
+from hardware import cpu_affinity
 from ui import (
     splash_screen,
     terms_screen,
@@ -45,6 +50,11 @@ from data import data_manager
 # Disable audio driver
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
+# Display configuration resolved once at import
+USE_PITFT = config.HARDWARE["USE_ADAFRUIT_PITFT"]
+SCREEN_W = config.SCREEN_WIDTH
+SCREEN_H = config.SCREEN_HEIGHT
+
 # ==============================================================================
 # 1. SHARED STATE AND GLOBAL EVENTS
 # ==============================================================================
@@ -52,6 +62,9 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 # Threading events for global coordination
 shutdown_flag = threading.Event()
 leak_detected_flag = threading.Event()
+# Wakes the main loop early when a spectrometer result, GPIO button press
+# or leak arrives
+frame_event = threading.Event()
 
 # Flags to indicate if references need to be re-captured
 dark_reference_required = True
@@ -71,7 +84,9 @@ white_reference_required = True
 #  @var integration_time_ms Integration time in milliseconds (100-6000ms menu range).
 #  @var collection_mode Data collection mode: "RAW" or "REFLECTANCE".
 #  @var scans_to_average Number of scans to average (0-50, where 0 = no averaging).
-@dataclass
+#  @note Uses __slots__ (no per-instance __dict__): the menu and live view read and
+#        write these fields every frame, and no other attributes are ever attached.
+@dataclass(slots=True)
 class SpectrometerSettings:
     integration_time_ms: int = config.SPECTROMETER.DEFAULT_INTEGRATION_TIME_MS
     collection_mode: str = config.MODES.DEFAULT_COLLECTION_MODE
@@ -86,38 +101,48 @@ class SpectrometerSettings:
 ## @brief Initialize pygame display based on hardware configuration.
 #
 #  Creates either a framebuffer surface (for Adafruit PiTFT) or a
-#  standard pygame window (for development/SSH). Disables mouse
-#  cursor and console cursor blink in framebuffer mode.
+#  standard pygame window (for development/SSH). In framebuffer mode
+#  only pygame.font is initialized and the console cursor blink is
+#  disabled.
 #
 #  @return pygame.Surface for rendering (SCREEN_WIDTH x SCREEN_HEIGHT).
 #  @pre Pygame must not be initialized before calling this function.
 #  @post Pygame is initialized and ready for rendering.
 def initialize_display():
-    if config.HARDWARE["USE_ADAFRUIT_PITFT"]:
+    if USE_PITFT:
         # Adafruit PiTFT Mode: Framebuffer rendering
         print("Configuring Pygame for Adafruit PiTFT (framebuffer mode)...")
 
         # Set SDL to dummy mode (no window, we'll write to framebuffer manually)
         os.environ["SDL_VIDEODRIVER"] = "dummy"
 
-        # Disable console cursor blink
+        # Disable console cursor blink (single unbuffered sysfs write)
         try:
-            with open("/sys/class/graphics/fbcon/cursor_blink", "w") as f:
-                f.write("0")
+            fd = os.open("/sys/class/graphics/fbcon/cursor_blink", os.O_WRONLY)
+            try:
+                os.write(fd, b"0")
+            finally:
+                os.close(fd)
             print("Console cursor blink disabled")
-        except Exception as e:
+        except OSError as e:
             print(f"WARNING: Could not disable cursor blink: {e}")
 
-        # Initialize pygame
-        pygame.init()
-        assert pygame.get_init(), "Pygame initialization failed"
+        # Initialize only the pygame font module; the surface is drawn in memory
+        # and copied to the framebuffer, so no SDL video/event subsystem is needed
+        pygame.font.init()
+        assert pygame.font.get_init(), "Pygame font initialization failed"
+
+        # Create a Surface (not a display window) in the framebuffer's own RGB565
+        # layout, so each flush is a straight copy with no per-pixel conversion
+        screen = pygame.Surface(
+            (SCREEN_W, SCREEN_H), 0, 16, display_utils.RGB565_MASKS
+        )
 
-        # Create a Surface (not a display window)
-        screen = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
-        pygame.mouse.set_visible(False)
+        # Map /dev/fb1 once; update_display() falls back to file writes if this fails
+        display_utils.open_framebuffer(screen)
 
         print(
-            f"Adafruit PiTFT: Pygame surface created ({config.SCREEN_WIDTH}x{config.SCREEN_HEIGHT})"
+            f"Adafruit PiTFT: Pygame surface created ({SCREEN_W}x{SCREEN_H})"
         )
         return screen
 
@@ -126,17 +151,17 @@ def initialize_display():
         print("Initializing standard Pygame display window...")
 
         # Make sure dummy mode is not set
-        if "SDL_VIDEODRIVER" in os.environ and os.environ["SDL_VIDEODRIVER"] == "dummy":
+        if os.environ.get("SDL_VIDEODRIVER") == "dummy":
             del os.environ["SDL_VIDEODRIVER"]
 
         pygame.init()
         assert pygame.get_init(), "Pygame initialization failed"
 
-        screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
         pygame.display.set_caption("PySB-App Spectrometer")
 
         print(
-            f"Standard Pygame window initialized ({config.SCREEN_WIDTH}x{config.SCREEN_HEIGHT})"
+            f"Standard Pygame window initialized ({SCREEN_W}x{SCREEN_H})"
         )
         return screen
 
@@ -146,12 +171,27 @@ def initialize_display():
 # ==============================================================================
 
 
+## @brief Request a graceful shutdown on SIGTERM or SIGHUP.
+#
+#  systemd stops the service (and a reboot ends it) with SIGTERM. In PiTFT
+#  mode SDL's event subsystem is not initialized, so the signal would not
+#  arrive as pygame.QUIT; without this handler the interpreter is killed and
+#  the cleanup in main() never runs.
+#
+#  @param[in] signum The signal number received.
+#  @param[in] frame The interrupted stack frame (unused).
+def handle_termination_signal(signum, frame):
+    print(f"Received {signal.Signals(signum).name}. Shutting down.")
+    shutdown_flag.set()
+    frame_event.set()  # Wake the main loop out of its frame wait
+
+
 ## @brief Main application entry point and orchestrator.
 #
 #  Initializes all hardware controllers, UI screens, and background threads.
 #  Runs the main UI loop with state machine transitions between MENU and
-#  SPECTROMETER screens. Handles graceful shutdown on keyboard interrupt
-#  or leak detection.
+#  SPECTROMETER screens. Handles graceful shutdown on keyboard interrupt,
+#  SIGTERM/SIGHUP or leak detection.
 #
 #  @details Execution flow:
 #  1. Initialize display (framebuffer or window)
@@ -167,27 +207,37 @@ def initialize_display():
 def main():
     global dark_reference_required, white_reference_required
 
+    # --- Signal Handling ---
+    # Turn service stop/reboot into an orderly exit through the finally block
+    signal.signal(signal.SIGTERM, handle_termination_signal)
+    signal.signal(signal.SIGHUP, handle_termination_signal)
+
     # --- Display Initialization ---
     screen = initialize_display()
-    clock = pygame.time.Clock()
+    leak_warning.prepare(screen)  # Render the leak screen now, not during a leak
 
     # --- Shared Data Instances ---
     spectrometer_settings = SpectrometerSettings()
 
     # Create thread-safe queues for communication
     spectrometer_request_queue = queue.Queue()
-    spectrometer_result_queue = queue.Queue()
-    data_manager_save_queue = queue.Queue()
+    spectrometer_result_queue = spectrometer_controller.LatestResultQueue(
+        maxsize=config.RESULT_QUEUE_MAXSIZE
+    )
+    data_manager_save_queue = queue.Queue(maxsize=config.SAVE_QUEUE_MAXSIZE)
 
     # --- Create Controller Instances ---
-    button_handler_inst = button_handler.ButtonHandler()
-    leak_sensor_inst = leak_sensor.LeakSensor(shutdown_flag, leak_detected_flag)
+    button_handler_inst = button_handler.ButtonHandler(wake_event=frame_event)
+    leak_sensor_inst = leak_sensor.LeakSensor(
+        shutdown_flag, leak_detected_flag, wake_event=frame_event
+    )
     network_info_inst = network_info.NetworkInfo(shutdown_flag)
     temp_sensor_inst = temp_sensor.TempSensorInfo(shutdown_flag)
     spec_controller_inst = spectrometer_controller.SpectrometerController(
         shutdown_flag=shutdown_flag,
         request_queue=spectrometer_request_queue,
         result_queue=spectrometer_result_queue,
+        frame_event=frame_event,
     )
     data_manager_inst = data_manager.DataManager(
         shutdown_flag=shutdown_flag,
@@ -218,6 +268,10 @@ def main():
     spec_controller_inst.start()
     data_manager_inst.start()
 
+    # Keep the UI on its own core, ahead of the background threads
+    cpu_affinity.pin_current_thread("UI")
+    cpu_affinity.raise_current_thread_priority(config.UI_THREAD_RT_PRIORITY)
+
     # --- Main Application Logic ---
     print("Entering main application logic...")
     app_state = "MENU"  # Initial state
@@ -228,9 +282,8 @@ def main():
         print("Splash screen done.")
 
         if leak_detected_flag.is_set():
-            leak_warning.show(screen)
-            display_utils.update_display(screen)
-            shutdown_flag.set()
+            shutdown_flag.set()  # Let the worker threads wind down during the hold
+            leak_warning.show(screen)  # Flushes the display itself
 
         if not shutdown_flag.is_set():
             print("Showing terms screen...")
@@ -238,27 +291,53 @@ def main():
             print("Terms screen done.")
 
             if leak_detected_flag.is_set():
-                leak_warning.show(screen)
-                display_utils.update_display(screen)
-                shutdown_flag.set()
+                shutdown_flag.set()  # Let the worker threads wind down during the hold
+                leak_warning.show(screen)  # Flushes the display itself
 
         # --- Main Application Loop ---
         print("Entering main loop...")
-        while not shutdown_flag.is_set():
+
+        # Bind per-frame calls to locals (LOAD_FAST instead of attribute chains)
+        shutdown_is_set = shutdown_flag.is_set
+        leak_is_set = leak_detected_flag.is_set
+        check_pygame_events = button_handler_inst.check_pygame_events
+        get_pressed = button_handler_inst.get_pressed
+        menu_begin_frame = menu_screen.begin_frame
+        menu_handle_input = menu_screen.handle_input
+        menu_draw = menu_screen.draw
+        spectro_update = spectro_screen.update
+        spectro_handle_input = spectro_screen.handle_input
+        spectro_draw = spectro_screen.draw
+        update_display = display_utils.update_display
+        frame_wait = frame_event.wait
+        frame_clear = frame_event.clear
+        monotonic = time.monotonic
+        frame_interval_s = config.MAIN_LOOP_DELAY_S
+        next_frame_time = monotonic()
+
+        while True:
+            # Each flag is sampled once per tick, before any work; the only
+            # blocking call is the frame wait at the bottom of the loop
+            if shutdown_is_set():
+                break
+
             # --- Event Handling ---
-            button_handler_inst.check_pygame_events()
-            if button_handler_inst.get_pressed("shutdown"):
+            check_pygame_events()
+            if get_pressed("shutdown"):
                 shutdown_flag.set()
+                break  # Don't render a frame we're about to tear down
 
-            if leak_detected_flag.is_set():
-                leak_warning.show(screen)
-                display_utils.update_display(screen)
-                shutdown_flag.set()
-                continue  # Skip the rest of the loop
+            if leak_is_set():
+                shutdown_flag.set()  # Let the worker threads wind down during the hold
+                leak_warning.show(screen)  # Flushes the display itself
+                break  # Skip the rest of the loop
 
             # --- State Machine ---
+            dirty = False
+            dirty_rects = None  # Whole screen unless the menu reports less
             if app_state == "MENU":
-                menu_action = menu_screen.handle_input()
+                menu_begin_frame()
+                menu_action = menu_handle_input()
                 if menu_action == "START_CAPTURE":
                     app_state = "SPECTROMETER"
                     spectro_screen.enter()  # Initialize spectrometer screen
@@ -273,24 +352,39 @@ def main():
                     white_reference_required = True
                     menu_screen.white_reference_required = False  # Reset flag
 
-                menu_screen.draw()
+                dirty = menu_draw()
+                dirty_rects = menu_screen.dirty_rects
 
             elif app_state == "SPECTROMETER":
                 # Update spectrometer screen (process new data from queue)
-                spectro_screen.update()
+                spectro_update()
 
                 # Handle input
-                screen_action = spectro_screen.handle_input()
+                screen_action = spectro_handle_input()
                 if screen_action == "MENU":
                     spectro_screen.exit()  # Cleanup spectrometer screen
                     app_state = "MENU"
-
-                # Draw spectrometer screen
-                spectro_screen.draw()
+                    menu_screen.invalidate()  # Surface holds the spectrometer screen
+                    menu_begin_frame()  # Last sample is from before the capture
+                    dirty = menu_draw()
+                else:
+                    # Draw spectrometer screen
+                    dirty = spectro_draw()
 
             # --- Screen Update ---
-            display_utils.update_display(screen)  # Use hardware-aware display update
-            clock.tick(30)  # Limit frame rate
+            if dirty:
+                update_display(screen, dirty_rects)  # Use hardware-aware display update
+
+            # --- Frame Pacing ---
+            # Sleep until the next frame slot, waking early on a new spectrum,
+            # GPIO button press or leak
+            next_frame_time += frame_interval_s
+            now = monotonic()
+            if next_frame_time < now:
+                next_frame_time = now  # Fell behind; don't try to catch up
+            else:
+                frame_wait(next_frame_time - now)
+            frame_clear()
 
     except KeyboardInterrupt:
         print("Keyboard interrupt detected. Shutting down.")
@@ -305,6 +399,7 @@ def main():
         temp_sensor_inst.stop()
         spec_controller_inst.stop()
         data_manager_inst.stop()
+        display_utils.close_framebuffer()
         pygame.quit()
         print("Application finished.")
 
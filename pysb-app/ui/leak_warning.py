@@ -4,33 +4,59 @@
 #  Displays a full-screen red warning when a leak is detected, instructing
 #  the user to wait for full shutdown before removing the housing.
 
+import time
+
 import pygame
 import config
-import time
 from ui import display_utils
 
 
-## @brief Display critical leak warning screen and wait for shutdown.
+## @brief How long show() keeps the warning up before returning (seconds).
+HOLD_S = 5.0
+
+## @brief Pre-rendered warning screen, built by prepare().
+_warning_surface = None
+
+## @brief Render the static leak warning ahead of time.
 #
-#  Fills the screen with red and displays a warning message about the
-#  detected leak. Holds for 5 seconds to allow the user to read the message
-#  before the application terminates.
+#  Called once at startup so that a leak only has to blit a finished surface.
+#  The warning is built with the screen's size and pixel format so it can be
+#  blitted without conversion. Does nothing if a matching surface exists.
 #
-#  @param[in] screen The pygame surface to draw on.
-def show(screen):
-    screen.fill(config.COLORS.RED)
+#  @param[in] screen The display surface the warning will be shown on.
+def prepare(screen):
+    global _warning_surface
+    if _warning_surface is not None and _warning_surface.get_size() == screen.get_size():
+        return
 
-    font_title = pygame.font.Font(None, 36)
-    font_body = pygame.font.Font(None, 24)
+    surface = pygame.Surface(screen.get_size(), 0, screen)
+    surface.fill(config.COLORS.RED)
+
+    font_title = display_utils.get_font(None, 36)
+    font_body = display_utils.get_font(None, 24)
 
     title_rect = pygame.Rect(0, 20, config.SCREEN_WIDTH, 50)
-    display_utils.draw_text(screen, "CRITICAL: LEAK DETECTED!", font_title, config.COLORS.WHITE, title_rect)
+    display_utils.draw_text(surface, "CRITICAL: LEAK DETECTED!", font_title, config.COLORS.WHITE, title_rect)
 
     body_rect = pygame.Rect(20, 80, config.SCREEN_WIDTH - 40, config.SCREEN_HEIGHT - 100)
     body_text = "Powering down immediately.\nDo NOT remove the housing until\nthe device is fully powered off."
-    display_utils.draw_text(screen, body_text, font_body, config.COLORS.WHITE, body_rect)
+    display_utils.draw_text(surface, body_text, font_body, config.COLORS.WHITE, body_rect)
+    _warning_surface = surface
+
+
+## @brief Display critical leak warning screen and wait for shutdown.
+#
+#  Fills the screen with red and displays a warning message about the
+#  detected leak. Holds for HOLD_S seconds to allow the user to read
+#  the message before the application terminates. Uses the surface rendered by
+#  prepare(), so no fonts are loaded or text wrapped on the leak path.
+#
+#  @param[in] screen The pygame surface to draw on.
+def show(screen):
+    prepare(screen)  # No-op when already rendered at startup
+    screen.blit(_warning_surface, (0, 0))
 
     display_utils.update_display(screen)
 
     # Keep the message on screen for a few seconds before shutdown
-    time.sleep(5)
+    time.sleep(HOLD_S)
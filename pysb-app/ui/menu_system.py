@@ -20,10 +20,29 @@
 
 import pygame
 import datetime
-import calendar
+import functools
+from collections import OrderedDict
 import config
 from ui import display_utils
 
+## @brief Days in each month of a non-leap year (January first).
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+##
+# @brief Formats a wavelength range for the menu, e.g. "400nm - 620nm".
+# @param wl_min Minimum wavelength in whole nm.
+# @param wl_max Maximum wavelength in whole nm.
+# @return Tuple (string, index of the first "nm", index of " - ").
+# @details Cached because draw() formats the range every frame while the
+#          values only move in WAVELENGTH_EDIT_STEP_NM steps. The indices let
+#          the edit box be placed without searching the string.
+@functools.lru_cache(maxsize=256)
+def _wavelength_range_str(wl_min, wl_max):
+    min_str = str(wl_min)
+    nm_idx = len(min_str)
+    return f"{min_str}nm - {wl_max}nm", nm_idx, nm_idx + 2
+
 
 ##
 # @class MenuSystem
@@ -35,6 +54,55 @@ from ui import display_utils
 class MenuSystem:
     """Manages and draws the main menu, handling navigation and settings changes."""
 
+    # Fixed attribute set: slot access is cheaper than instance-dict lookups in the
+    # per-frame input/draw paths (the edit math itself is too small to compile)
+    __slots__ = (
+        "screen",
+        "button_handler",
+        "settings",
+        "_wl_step",
+        "_wl_min_limit",
+        "_wl_max_limit",
+        "_wl_min_gap",
+        "network_info",
+        "temp_sensor",
+        "font_title",
+        "font_item",
+        "font_value",
+        "_value_font_height",
+        "font_info",
+        "_title_surf",
+        "_glyph_widths",
+        "_glyphs",
+        "_menu_items",
+        "_selected_index",
+        "_selected_item",
+        "_selected_type",
+        "_edit_mode",
+        "dark_reference_required",
+        "white_reference_required",
+        "_time_offset",
+        "_frame_now",
+        "_original_offset_on_edit_start",
+        "_datetime_being_edited",
+        "_editing_field",
+        "_wl_edit_min",
+        "_wl_edit_max",
+        "_original_wavelength_range",
+        "_last_draw_key",
+        "_composite",
+        "_composite_key",
+        "_composite_rows",
+        "_composite_hint",
+        "dirty_rects",
+        "_last_fmt_key",
+        "_last_fmt_str",
+        "_size_cache",
+        "_text_cache",
+        "_n_items",
+        "_edit_handlers",
+    )
+
     # Field constants for date/time editing
     FIELD_YEAR, FIELD_MONTH, FIELD_DAY = "year", "month", "day"
     FIELD_HOUR, FIELD_MINUTE = "hour", "minute"
@@ -42,6 +110,25 @@ class MenuSystem:
     # Field constants for wavelength range editing
     FIELD_WL_MIN, FIELD_WL_MAX = "wl_min", "wl_max"
 
+    # Field -> (next field, editing complete) for ENTER while editing
+    _DATETIME_NEXT = {
+        FIELD_YEAR: (FIELD_MONTH, False),
+        FIELD_MONTH: (FIELD_DAY, False),
+        FIELD_DAY: (FIELD_HOUR, False),
+        FIELD_HOUR: (FIELD_MINUTE, False),
+        FIELD_MINUTE: (None, True),
+    }
+    _WAVELENGTH_NEXT = {
+        FIELD_WL_MIN: (FIELD_WL_MAX, False),
+        FIELD_WL_MAX: (None, True),
+    }
+
+    # Upper bound on cached text surfaces (hints and scrolled values)
+    TEXT_CACHE_SIZE = 64
+
+    # Characters of the date/time and plot range values, pre-rendered as glyphs
+    GLYPH_CHARS = "0123456789-: nm"
+
     ##
     # @brief Initializes the MenuSystem.
     # @param screen The Pygame surface to draw on.
@@ -70,6 +157,22 @@ class MenuSystem:
         # @brief SpectrometerSettings dataclass holding current configuration.
         self.settings = settings
 
+        ## @var _wl_step
+        # @brief Wavelength range edit step (nm), fixed for the session.
+        self._wl_step = config.PLOTTING.WAVELENGTH_EDIT_STEP_NM
+
+        ## @var _wl_min_limit
+        # @brief Lowest wavelength (nm) the range can be edited down to.
+        self._wl_min_limit = config.PLOTTING.WAVELENGTH_EDIT_MIN_LIMIT_NM
+
+        ## @var _wl_max_limit
+        # @brief Highest wavelength (nm) the range can be edited up to.
+        self._wl_max_limit = config.PLOTTING.WAVELENGTH_EDIT_MAX_LIMIT_NM
+
+        ## @var _wl_min_gap
+        # @brief Minimum gap (nm) kept between the range minimum and maximum.
+        self._wl_min_gap = config.PLOTTING.WAVELENGTH_EDIT_MIN_GAP_NM
+
         ## @var network_info
         # @brief NetworkInfo instance for network status display.
         self.network_info = network_info
@@ -80,32 +183,53 @@ class MenuSystem:
 
         ## @var font_title
         # @brief Font for the menu title.
-        try:
-            self.font_title = pygame.font.Font(
-                config.FONTS.TITLE, config.FONT_SIZES.TITLE
-            )
-        except:
-            self.font_title = pygame.font.Font(None, config.FONT_SIZES.TITLE)
+        self.font_title = display_utils.load_font(
+            config.FONTS.TITLE, config.FONT_SIZES.TITLE
+        )
 
         ## @var font_item
         # @brief Font for menu item labels.
-        try:
-            self.font_item = pygame.font.Font(
-                config.FONTS.MAIN, config.FONT_SIZES.MENU_ITEM
-            )
-        except:
-            self.font_item = pygame.font.Font(None, config.FONT_SIZES.MENU_ITEM)
+        self.font_item = display_utils.load_font(
+            config.FONTS.MAIN, config.FONT_SIZES.MENU_ITEM
+        )
 
         ## @var font_value
         # @brief Font for menu item values (same as font_item).
         self.font_value = self.font_item
 
+        ## @var _value_font_height
+        # @brief Line height of font_value, used for the edit boxes.
+        self._value_font_height = self.font_value.get_height()
+
         ## @var font_info
         # @brief Font for network information display.
-        try:
-            self.font_info = pygame.font.Font(config.FONTS.MAIN, config.FONT_SIZES.INFO)
-        except:
-            self.font_info = pygame.font.Font(None, config.FONT_SIZES.INFO)
+        self.font_info = display_utils.load_font(config.FONTS.MAIN, config.FONT_SIZES.INFO)
+
+        ## @var _glyph_widths
+        # @brief Advance width of each GLYPH_CHARS character in font_value.
+        self._glyph_widths = {ch: self.font_value.size(ch)[0] for ch in self.GLYPH_CHARS}
+
+        ## @var _glyphs
+        # @brief Value color -> {char: pre-rendered glyph} for GLYPH_CHARS (see _compose_glyphs()).
+        #        Left empty if the font kerns these characters, since composing
+        #        glyph by glyph would then not match a whole-string render.
+        self._glyphs = {}
+        if all(
+            self.font_value.size(sample)[0]
+            == sum(self._glyph_widths[ch] for ch in sample)
+            for sample in ("2025-11-09 13:21", "400nm - 620nm")
+        ):
+            for color in (config.COLORS.CYAN, config.COLORS.YELLOW):
+                self._glyphs[color] = {
+                    ch: self._render_static_text(self.font_value, ch, color)
+                    for ch in self.GLYPH_CHARS
+                }
+
+        ## @var _title_surf
+        # @brief Pre-rendered menu title.
+        self._title_surf = self._render_static_text(
+            self.font_title, "OPEN SPECTRO MENU", config.COLORS.YELLOW
+        )
 
         ## @var _menu_items
         # @brief List of menu item dictionaries defining structure and behavior.
@@ -115,6 +239,14 @@ class MenuSystem:
         # @brief Index of the currently selected menu item.
         self._selected_index = 0
 
+        ## @var _selected_item
+        # @brief Menu item dictionary at _selected_index (see _set_selected()).
+        self._selected_item = None
+
+        ## @var _selected_type
+        # @brief "type" of _selected_item.
+        self._selected_type = None
+
         ## @var _edit_mode
         # @brief Boolean indicating if a value is being edited.
         self._edit_mode = False
@@ -131,6 +263,10 @@ class MenuSystem:
         # @brief Time offset (timedelta) applied to system time for display and CSV timestamps.
         self._time_offset = datetime.timedelta(0)
 
+        ## @var _frame_now
+        # @brief System time sampled by begin_frame() (None: read the clock on each call).
+        self._frame_now = None
+
         ## @var _original_offset_on_edit_start
         # @brief Backup of time offset when entering date/time edit mode (for cancel operation).
         self._original_offset_on_edit_start = None
@@ -143,14 +279,59 @@ class MenuSystem:
         # @brief Currently selected field when editing date/time or wavelength range.
         self._editing_field = None
 
-        ## @var _wavelength_range_editing
-        # @brief Temporary wavelength range values being edited [min, max].
-        self._wavelength_range_editing = None
+        ## @var _wl_edit_min
+        # @brief Minimum wavelength (nm) being edited (None when not editing the range).
+        self._wl_edit_min = None
+
+        ## @var _wl_edit_max
+        # @brief Maximum wavelength (nm) being edited (None when not editing the range).
+        self._wl_edit_max = None
 
         ## @var _original_wavelength_range
-        # @brief Backup of wavelength range when entering edit mode (for cancel operation).
+        # @brief (min, max) backup of wavelength range when entering edit mode (for cancel operation).
         self._original_wavelength_range = None
 
+        ## @var _last_draw_key
+        # @brief Snapshot of everything shown by the last draw() (None forces a redraw).
+        self._last_draw_key = None
+
+        ## @var _composite
+        # @brief Offscreen copy of the rendered menu, in the screen's pixel format.
+        self._composite = screen.copy()
+
+        ## @var _composite_key
+        # @brief Draw key of the menu currently rendered into _composite (None if stale).
+        self._composite_key = None
+
+        ## @var _composite_rows
+        # @brief Per-row state painted into _composite (None until the first full paint).
+        self._composite_rows = None
+
+        ## @var _composite_hint
+        # @brief Hint text painted into _composite.
+        self._composite_hint = None
+
+        ## @var dirty_rects
+        # @brief Screen areas changed by the last draw() that returned True, or None
+        #        if the whole screen was repainted. Pass to display_utils.update_display().
+        self.dirty_rects = None
+
+        ## @var _last_fmt_key
+        # @brief (year, month, day, hour, minute) of the last datetime formatted for display.
+        self._last_fmt_key = None
+
+        ## @var _last_fmt_str
+        # @brief Display string for _last_fmt_key (see _format_datetime()).
+        self._last_fmt_str = ""
+
+        ## @var _size_cache
+        # @brief font_value widths by text, for the edit-box prefixes (see _text_width()).
+        self._size_cache = {}
+
+        ## @var _text_cache
+        # @brief LRU of rendered text surfaces keyed by (font, text, color) (see _render_text()).
+        self._text_cache = OrderedDict()
+
         self._build_menu_items()
 
     ##
@@ -190,8 +371,63 @@ class MenuSystem:
             {"label": "WiFi", "type": "info", "display": "wifi"},
             {"label": "IP", "type": "info", "display": "ip"},
         ]
+        # Per-type row functions for draw(), chosen once instead of branching per frame
+        row_functions = {
+            "numeric": MenuSystem._row_setting,
+            "choice": MenuSystem._row_setting,
+            "datetime": MenuSystem._row_datetime,
+            "wavelength_range": MenuSystem._row_wavelength,
+            "fan_threshold": MenuSystem._row_fan_threshold,
+            "info": MenuSystem._row_info,
+        }
+        for item in self._menu_items:
+            # Checked once here rather than on every draw()
+            assert isinstance(item, dict), "Menu item must be a dictionary"
+            if "value_key" in item:
+                # Bound accessors for the setting (C-level partials, no name lookup per call)
+                item["_get"] = functools.partial(getattr, self.settings, item["value_key"])
+                item["_set"] = functools.partial(setattr, self.settings, item["value_key"])
+            item["_row"] = row_functions.get(item["type"], MenuSystem._row_none)
+            if item["type"] == "info":
+                # Last string shown and its color (see _row_info())
+                item["_cached_str"] = None
+                item["_cached_color"] = config.COLORS.CYAN
         assert len(self._menu_items) > 0, "Menu must have at least one item"
 
+        ## @var _n_items
+        # @brief Number of menu items, for wrapping the selection.
+        self._n_items = len(self._menu_items)
+        self._set_selected(self._selected_index)
+
+        ## @var _edit_handlers
+        # @brief Item type -> method adjusting its value by a direction of -1/+1 in
+        #        edit mode; types not listed use _change_value().
+        self._edit_handlers = {
+            "datetime": self._change_datetime_field,
+            "wavelength_range": self._change_wavelength_field,
+        }
+
+        # Labels only ever appear in the normal and selected colors; render them up front
+        for item in self._menu_items:
+            item["_label_surf_white"] = self._render_static_text(
+                self.font_item, item["label"], config.COLORS.WHITE
+            )
+            item["_label_surf_yellow"] = self._render_static_text(
+                self.font_item, item["label"], config.COLORS.YELLOW
+            )
+
+    ##
+    # @brief Selects a menu item, caching the item and its type.
+    # @param index Index into _menu_items.
+    # @details All selection changes go through here so _selected_item and
+    #          _selected_type always match _selected_index.
+    def _set_selected(self, index):
+        """Sets the selected index along with the cached item and type."""
+        assert 0 <= index < self._n_items, "Selected index out of range"
+        self._selected_index = index
+        self._selected_item = self._menu_items[index]
+        self._selected_type = self._selected_item.get("type")
+
     ##
     # @brief Processes button presses and updates the menu state.
     # @return Action string ("START_CAPTURE", "QUIT") or None if no action taken.
@@ -200,43 +436,30 @@ class MenuSystem:
     #          value adjustment when editing.
     def handle_input(self):
         """Processes button presses and updates the menu state. Returns any action."""
+        if not self.button_handler.any_pressed():
+            return None  # No input this frame
+
         action = None
 
         if self.button_handler.get_pressed(config.BTN_UP):
             if self._edit_mode:
                 # In edit mode: UP adjusts value up
-                selected_item = self._menu_items[self._selected_index]
-                if selected_item.get("type") == "datetime":
-                    self._change_datetime_field(1)
-                elif selected_item.get("type") == "wavelength_range":
-                    self._change_wavelength_field(1)
-                else:
-                    self._change_value(1)
+                self._edit_handlers.get(self._selected_type, self._change_value)(1)
             else:
                 # Navigation mode: UP moves selection up
-                self._selected_index = (self._selected_index - 1) % len(
-                    self._menu_items
-                )
+                self._set_selected((self._selected_index - 1) % self._n_items)
 
         elif self.button_handler.get_pressed(config.BTN_DOWN):
             if self._edit_mode:
                 # In edit mode: DOWN adjusts value down
-                selected_item = self._menu_items[self._selected_index]
-                if selected_item.get("type") == "datetime":
-                    self._change_datetime_field(-1)
-                elif selected_item.get("type") == "wavelength_range":
-                    self._change_wavelength_field(-1)
-                else:
-                    self._change_value(-1)
+                self._edit_handlers.get(self._selected_type, self._change_value)(-1)
             else:
                 # Navigation mode: DOWN moves selection down
-                self._selected_index = (self._selected_index + 1) % len(
-                    self._menu_items
-                )
+                self._set_selected((self._selected_index + 1) % self._n_items)
 
         elif self.button_handler.get_pressed(config.BTN_ENTER):
-            selected_item = self._menu_items[self._selected_index]
-            item_type = selected_item.get("type")
+            selected_item = self._selected_item
+            item_type = self._selected_type
 
             if item_type == "action":
                 return selected_item.get("action")  # e.g., "START_CAPTURE"
@@ -264,29 +487,27 @@ class MenuSystem:
                         # All fields complete - save and exit
                         self._commit_wavelength_range_changes()
                         self._edit_mode = False
-                        self._wavelength_range_editing = None
+                        self._wl_edit_min = self._wl_edit_max = None
                         self._editing_field = None
 
         elif self.button_handler.get_pressed(config.BTN_BACK):
             if self._edit_mode:
                 # Exit edit mode
-                selected_item = self._menu_items[self._selected_index]
-                if selected_item.get("type") == "datetime":
+                item_type = self._selected_type
+                if item_type == "datetime":
                     # Restore original time offset (cancel changes)
                     if self._original_offset_on_edit_start is not None:
                         self._time_offset = self._original_offset_on_edit_start
                     self._datetime_being_edited = None
                     self._editing_field = None
-                elif selected_item.get("type") == "wavelength_range":
+                elif item_type == "wavelength_range":
                     # Restore original wavelength range (cancel changes)
                     if self._original_wavelength_range is not None:
-                        config.PLOTTING.WAVELENGTH_RANGE_MIN_NM = (
-                            self._original_wavelength_range[0]
-                        )
-                        config.PLOTTING.WAVELENGTH_RANGE_MAX_NM = (
-                            self._original_wavelength_range[1]
-                        )
-                    self._wavelength_range_editing = None
+                        (
+                            config.PLOTTING.WAVELENGTH_RANGE_MIN_NM,
+                            config.PLOTTING.WAVELENGTH_RANGE_MAX_NM,
+                        ) = self._original_wavelength_range
+                    self._wl_edit_min = self._wl_edit_max = None
                     self._editing_field = None
                 self._edit_mode = False
 
@@ -301,9 +522,8 @@ class MenuSystem:
         assert isinstance(direction, int), "direction must be an integer"
         assert direction in (-1, 1), "direction must be -1 or 1"
 
-        selected_item = self._menu_items[self._selected_index]
-        item_type = selected_item.get("type")
-        key = selected_item.get("value_key")
+        selected_item = self._selected_item
+        item_type = self._selected_type
 
         # A setting was changed, so references are now invalid (for spectrometer settings).
         # Fan threshold changes do not affect spectrometer references.
@@ -312,21 +532,21 @@ class MenuSystem:
             self.white_reference_required = True
 
         if item_type == "numeric":
-            current_val = getattr(self.settings, key)
+            current_val = selected_item["_get"]()
             step = selected_item["step"]
             new_val = current_val + (step * direction)
             new_val = max(selected_item["min"], min(selected_item["max"], new_val))
-            setattr(self.settings, key, new_val)
+            selected_item["_set"](new_val)
 
         elif item_type == "choice":
             choices = selected_item["choices"]
-            current_val = getattr(self.settings, key)
+            current_val = selected_item["_get"]()
             try:
                 current_idx = choices.index(current_val)
                 new_idx = (current_idx + direction) % len(choices)
-                setattr(self.settings, key, choices[new_idx])
+                selected_item["_set"](choices[new_idx])
             except ValueError:
-                setattr(self.settings, key, choices[0])
+                selected_item["_set"](choices[0])
 
         elif item_type == "fan_threshold":
             # Adjust fan threshold via temp_sensor
@@ -340,21 +560,33 @@ class MenuSystem:
                 )
                 self.temp_sensor.set_fan_threshold_c(new_threshold)
 
+    ##
+    # @brief Samples the system clock once for the coming menu frame.
+    # @details Call once per main-loop iteration before handle_input() and draw().
+    #          Until the next call, get_current_display_time() uses this sample instead
+    #          of reading the clock again. The offset is still applied on each read, so
+    #          a time edit committed mid-frame shows up in the same frame's draw().
+    def begin_frame(self):
+        """Caches the current system time for this frame."""
+        self._frame_now = datetime.datetime.now()
+
     ##
     # @brief Gets the current display time with applied time offset.
     # @return datetime.datetime object with offset applied.
     # @details This method should be used for all time displays and CSV timestamps.
+    #          Uses the time sampled by begin_frame() when there is one.
     def get_current_display_time(self):
         """Returns the current time with the time offset applied."""
         assert isinstance(
             self._time_offset, datetime.timedelta
         ), "Time offset must be a timedelta"
+        now = self._frame_now or datetime.datetime.now()
         try:
-            return datetime.datetime.now() + self._time_offset
+            return now + self._time_offset
         except OverflowError:
             print("WARNING: Time offset overflow. Resetting to zero.")
             self._time_offset = datetime.timedelta(0)
-            return datetime.datetime.now()
+            return now
 
     ##
     # @brief Enters edit mode for date/time fields.
@@ -383,22 +615,10 @@ class MenuSystem:
         assert self._editing_field is not None, "Editing field must be set"
 
         # Combined datetime: year → month → day → hour → minute
-        if self._editing_field == self.FIELD_YEAR:
-            self._editing_field = self.FIELD_MONTH
-            return False
-        elif self._editing_field == self.FIELD_MONTH:
-            self._editing_field = self.FIELD_DAY
-            return False
-        elif self._editing_field == self.FIELD_DAY:
-            self._editing_field = self.FIELD_HOUR
-            return False
-        elif self._editing_field == self.FIELD_HOUR:
-            self._editing_field = self.FIELD_MINUTE
-            return False
-        elif self._editing_field == self.FIELD_MINUTE:
-            return True  # Complete
-
-        return False
+        next_field, done = self._DATETIME_NEXT.get(self._editing_field, (None, False))
+        if next_field:
+            self._editing_field = next_field
+        return done
 
     ##
     # @brief Changes the value of the currently selected datetime field.
@@ -435,7 +655,8 @@ class MenuSystem:
         elif self._editing_field == self.FIELD_MONTH:
             m = (m - 1 + delta + 12) % 12 + 1
         elif self._editing_field == self.FIELD_DAY:
-            max_d = calendar.monthrange(y, m)[1]
+            leap = y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)
+            max_d = 29 if m == 2 and leap else _DAYS_IN_MONTH[m - 1]
             d = (d - 1 + delta + max_d) % max_d + 1
 
         new_dt = self._get_safe_datetime(y, m, d, dt.hour, dt.minute, dt.second)
@@ -501,14 +722,11 @@ class MenuSystem:
     def _enter_wavelength_range_edit_mode(self):
         """Enters wavelength range edit mode, saving current values and setting initial field."""
         self._edit_mode = True
-        self._original_wavelength_range = [
+        self._original_wavelength_range = (
             config.PLOTTING.WAVELENGTH_RANGE_MIN_NM,
             config.PLOTTING.WAVELENGTH_RANGE_MAX_NM,
-        ]
-        self._wavelength_range_editing = [
-            config.PLOTTING.WAVELENGTH_RANGE_MIN_NM,
-            config.PLOTTING.WAVELENGTH_RANGE_MAX_NM,
-        ]
+        )
+        self._wl_edit_min, self._wl_edit_max = self._original_wavelength_range
         self._editing_field = self.FIELD_WL_MIN
 
     ##
@@ -518,13 +736,11 @@ class MenuSystem:
         """Advances to the next field in wavelength range editing. Returns True if complete."""
         assert self._editing_field is not None, "Editing field must be set"
 
-        if self._editing_field == self.FIELD_WL_MIN:
-            self._editing_field = self.FIELD_WL_MAX
-            return False
-        elif self._editing_field == self.FIELD_WL_MAX:
-            return True  # Complete
-
-        return False
+        # min → max
+        next_field, done = self._WAVELENGTH_NEXT.get(self._editing_field, (None, False))
+        if next_field:
+            self._editing_field = next_field
+        return done
 
     ##
     # @brief Changes the value of the currently selected wavelength range field.
@@ -533,75 +749,270 @@ class MenuSystem:
     def _change_wavelength_field(self, delta):
         """Changes the value of the currently selected wavelength range field."""
         assert isinstance(delta, int) and delta in (-1, 1), "Delta must be -1 or 1"
-        assert (
-            self._wavelength_range_editing is not None
-        ), "No wavelength range being edited"
+        assert self._wl_edit_min is not None, "No wavelength range being edited"
         assert self._editing_field is not None, "No field selected"
 
-        step = config.PLOTTING.WAVELENGTH_EDIT_STEP_NM
-        min_limit = config.PLOTTING.WAVELENGTH_EDIT_MIN_LIMIT_NM
-        max_limit = config.PLOTTING.WAVELENGTH_EDIT_MAX_LIMIT_NM
-        min_gap = config.PLOTTING.WAVELENGTH_EDIT_MIN_GAP_NM
+        step = self._wl_step
+        min_limit = self._wl_min_limit
+        max_limit = self._wl_max_limit
+        min_gap = self._wl_min_gap
 
         if self._editing_field == self.FIELD_WL_MIN:
             # Editing minimum wavelength
-            new_min = self._wavelength_range_editing[0] + (step * delta)
+            new_min = self._wl_edit_min + (step * delta)
             # Clamp to limits and ensure gap with max
-            new_min = max(
-                min_limit, min(new_min, self._wavelength_range_editing[1] - min_gap)
-            )
-            self._wavelength_range_editing[0] = new_min
+            new_min = max(min_limit, min(new_min, self._wl_edit_max - min_gap))
+            self._wl_edit_min = new_min
         elif self._editing_field == self.FIELD_WL_MAX:
             # Editing maximum wavelength
-            new_max = self._wavelength_range_editing[1] + (step * delta)
+            new_max = self._wl_edit_max + (step * delta)
             # Clamp to limits and ensure gap with min
-            new_max = max(
-                self._wavelength_range_editing[0] + min_gap, min(new_max, max_limit)
-            )
-            self._wavelength_range_editing[1] = new_max
+            new_max = max(self._wl_edit_min + min_gap, min(new_max, max_limit))
+            self._wl_edit_max = new_max
 
     ##
     # @brief Commits the edited wavelength range to config.
     def _commit_wavelength_range_changes(self):
         """Commits the edited wavelength range to config."""
-        assert (
-            self._wavelength_range_editing is not None
-        ), "No wavelength range to commit"
-        config.PLOTTING.WAVELENGTH_RANGE_MIN_NM = self._wavelength_range_editing[0]
-        config.PLOTTING.WAVELENGTH_RANGE_MAX_NM = self._wavelength_range_editing[1]
+        assert self._wl_edit_min is not None, "No wavelength range to commit"
+        config.PLOTTING.WAVELENGTH_RANGE_MIN_NM = self._wl_edit_min
+        config.PLOTTING.WAVELENGTH_RANGE_MAX_NM = self._wl_edit_max
         print(
             f"INFO: Wavelength range updated to "
-            f"{self._wavelength_range_editing[0]:.0f}nm - {self._wavelength_range_editing[1]:.0f}nm"
+            f"{self._wl_edit_min:.0f}nm - {self._wl_edit_max:.0f}nm"
+        )
+
+    ##
+    # @brief Formats a datetime as "YYYY-MM-DD HH:MM", reusing the last result within a minute.
+    # @param dt datetime.datetime to format.
+    # @return The formatted string.
+    # @details draw() formats the displayed time every frame, but the text only
+    #          changes once a minute, so strftime() runs at most once per minute shown.
+    def _format_datetime(self, dt):
+        """Returns dt as "YYYY-MM-DD HH:MM", cached per minute."""
+        key = (dt.year, dt.month, dt.day, dt.hour, dt.minute)
+        if key != self._last_fmt_key:
+            self._last_fmt_str = dt.strftime("%Y-%m-%d %H:%M")
+            self._last_fmt_key = key
+        return self._last_fmt_str
+
+    ##
+    # @brief Row function for items without a value (actions).
+    # @param item Menu item dictionary.
+    # @param editing True if this item is being edited.
+    # @return Tuple (value string or None, RGB value color, edit-box layout) for draw().
+    def _row_none(self, item, editing):
+        """Returns an empty value row."""
+        return None, config.COLORS.CYAN, None
+
+    ##
+    # @brief Row function for items bound to a settings field (numeric, choice).
+    # @param item Menu item dictionary with a value_key.
+    # @param editing True if this item is being edited.
+    # @return Tuple (value string, RGB value color, None) for draw().
+    def _row_setting(self, item, editing):
+        """Returns the setting's current value."""
+        color = config.COLORS.YELLOW if editing else config.COLORS.CYAN
+        return str(item["_get"]()), color, None
+
+    ##
+    # @brief Row function for the combined date/time item.
+    # @param item Menu item dictionary of type "datetime".
+    # @param editing True if this item is being edited.
+    # @return Tuple (value string, RGB value color, datetime shown) for draw().
+    def _row_datetime(self, item, editing):
+        """Returns the displayed (or edited) date and time."""
+        # Use edited datetime if currently editing this field, otherwise use display time
+        dt_to_display = (
+            self._datetime_being_edited
+            if editing and self._datetime_being_edited
+            else self.get_current_display_time()
         )
+        # Combined format: "2025-11-09 13:21"
+        color = config.COLORS.YELLOW if editing else config.COLORS.CYAN
+        return self._format_datetime(dt_to_display), color, dt_to_display
+
+    ##
+    # @brief Row function for the plot wavelength range item.
+    # @param item Menu item dictionary of type "wavelength_range".
+    # @param editing True if this item is being edited.
+    # @return Tuple (value string, RGB value color, (nm_idx, sep_idx)) for draw().
+    def _row_wavelength(self, item, editing):
+        """Returns the configured (or edited) wavelength range."""
+        # Use edited values if currently editing, otherwise use config values
+        if editing and self._wl_edit_min is not None:
+            wl_min = self._wl_edit_min
+            wl_max = self._wl_edit_max
+            color = config.COLORS.YELLOW
+        else:
+            wl_min = config.PLOTTING.WAVELENGTH_RANGE_MIN_NM
+            wl_max = config.PLOTTING.WAVELENGTH_RANGE_MAX_NM
+            color = config.COLORS.CYAN
+
+        # Format: "400nm - 620nm"
+        value, nm_idx, sep_idx = _wavelength_range_str(int(wl_min), int(wl_max))
+        return value, color, (nm_idx, sep_idx)
+
+    ##
+    # @brief Row function for the fan threshold item, with the live temperature.
+    # @param item Menu item dictionary of type "fan_threshold".
+    # @param editing True if this item is being edited.
+    # @return Tuple (value string, RGB value color, None) for draw().
+    def _row_fan_threshold(self, item, editing):
+        """Returns the fan threshold and current temperature."""
+        if self.temp_sensor is None:
+            return "Not Available", config.COLORS.GRAY, None
+
+        threshold = self.temp_sensor.get_fan_threshold_c()
+        temp = self.temp_sensor.get_temperature_c()
+        if isinstance(temp, (float, int)):
+            value = f"Threshold {threshold}C (Current {temp:.0f}C)"
+        else:
+            value = f"Threshold {threshold}C (Temp: {temp})"
+        color = config.COLORS.YELLOW if editing else config.COLORS.CYAN
+        return value, color, None
+
+    ##
+    # @brief Row function for the WiFi/IP info items.
+    # @param item Menu item dictionary of type "info".
+    # @param editing Unused (info items are read-only).
+    # @return Tuple (value string, RGB value color, None) for draw().
+    # @details Network status changes on a scale of seconds to minutes, so the
+    #          color is only worked out again when the string differs from the
+    #          one cached on the item; the rendered surface comes from _render_text().
+    def _row_info(self, item, editing):
+        """Returns an info item's value, recomputing its color only on change."""
+        display_type = item.get("display")
+        if display_type == "wifi":
+            value = self.network_info.get_wifi_name()
+        elif display_type == "ip":
+            value = self.network_info.get_ip_address()
+        else:
+            return None, config.COLORS.CYAN, None
+
+        if value != item["_cached_str"]:
+            item["_cached_str"] = value
+            # Grey out if not connected / no IP
+            if display_type == "wifi":
+                unavailable = "Not Connected" in value or "Error" in value
+            else:
+                unavailable = "No IP" in value or "Error" in value
+            item["_cached_color"] = (
+                config.COLORS.GRAY if unavailable else config.COLORS.CYAN
+            )
+        return value, item["_cached_color"], None
+
+    ##
+    # @brief Renders text once into a surface in the screen's pixel format.
+    # @param font pygame.font.Font to render with.
+    # @param text String to render.
+    # @param color RGB tuple for the text.
+    # @return Opaque pygame.Surface with a black colorkey.
+    # @details font.render() returns a per-pixel-alpha surface, and blitting that onto
+    #          the RGB565 PiTFT screen blends and converts every pixel on each blit.
+    #          The menu is always drawn on black, so the text is blended onto black once
+    #          here and black is made the colorkey: blits become a plain format-matched
+    #          copy with identical output. (Surface.convert() would need an SDL display,
+    #          which framebuffer mode does not initialise.)
+    def _render_static_text(self, font, text, color):
+        """Returns text rendered onto black in the screen format, black keyed out."""
+        text_surf = font.render(text, True, color)
+        surface = pygame.Surface(text_surf.get_size(), 0, self.screen)
+        surface.fill(config.COLORS.BLACK)
+        surface.blit(text_surf, (0, 0))
+        surface.set_colorkey(config.COLORS.BLACK)
+        return surface
+
+    ##
+    # @brief Builds a value surface by blitting pre-rendered glyphs side by side.
+    # @param text String made only of GLYPH_CHARS.
+    # @param glyphs {char: glyph surface} for the wanted color (from _glyphs).
+    # @return Surface in the same form as _render_static_text() returns.
+    # @details Scrubbing a date or plot range field produces a new string on every
+    #          press, each a cache miss in _render_text(). Composing it from glyphs
+    #          is a handful of copies instead of a FreeType render, with identical
+    #          pixels as long as the font does not kern (checked in __init__).
+    def _compose_glyphs(self, text, glyphs):
+        """Returns text assembled from cached glyph surfaces."""
+        widths = self._glyph_widths
+        surface = pygame.Surface(
+            (sum(widths[ch] for ch in text), self.font_value.get_height()), 0, self.screen
+        )
+        surface.fill(config.COLORS.BLACK)
+        blit_seq = []
+        x = 0
+        for ch in text:
+            blit_seq.append((glyphs[ch], (x, 0)))
+            x += widths[ch]
+        surface.blits(blit_seq, doreturn=False)
+        surface.set_colorkey(config.COLORS.BLACK)
+        return surface
+
+    ##
+    # @brief Renders text with antialiasing, reusing a cached surface when possible.
+    # @param font pygame.font.Font to render with.
+    # @param text String to render.
+    # @param color RGB tuple for the text.
+    # @return pygame.Surface holding the rendered text (shared; do not draw on it).
+    # @details Choice strings, hints and the values a user scrolls through
+    #          repeat constantly, and glyph rasterisation is the slowest part of a
+    #          menu repaint on the Pi. Entries are built by _render_static_text(), so
+    #          they blit as plain copies too. The least recently used entry is evicted
+    #          once TEXT_CACHE_SIZE surfaces are held.
+    def _render_text(self, font, text, color):
+        """Returns a cached antialiased render of text."""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            glyphs = self._glyphs.get(color) if font is self.font_value else None
+            if glyphs is not None and all(ch in glyphs for ch in text):
+                surface = self._compose_glyphs(text, glyphs)
+            else:
+                surface = self._render_static_text(font, text, color)
+            self._text_cache[key] = surface
+            if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
+
+    ##
+    # @brief Returns the rendered width of text in font_value, memoized.
+    # @param text String to measure.
+    # @return Width in pixels.
+    # @details The edit boxes only ever measure short date and wavelength prefixes,
+    #          a small bounded set, so the cache stays tiny and saturates quickly.
+    def _text_width(self, text):
+        """Returns the font_value width of text, caching the result."""
+        width = self._size_cache.get(text)
+        if width is None:
+            width = self.font_value.size(text)[0]
+            self._size_cache[text] = width
+        return width
 
     ##
     # @brief Calculates the rectangle around the currently edited wavelength range field.
     # @param value_str The wavelength range string being displayed.
+    # @param nm_idx Index of the "nm" ending the minimum in value_str.
+    # @param sep_idx Index of the " - " separator in value_str.
     # @param value_x The x-coordinate where the value starts.
     # @param value_y The y-coordinate where the value is rendered.
     # @return pygame.Rect for the blue box, or None if field is unknown.
     # @details Wavelength range format is "###nm - ###nm" (e.g., "400nm - 620nm").
-    def _calculate_wavelength_field_rect(self, value_str, value_x, value_y):
+    def _calculate_wavelength_field_rect(
+        self, value_str, nm_idx, sep_idx, value_x, value_y
+    ):
         """Calculates the rectangle around the currently edited wavelength range field."""
         assert self._editing_field is not None, "Editing field must be set"
 
-        # Format: "400nm - 620nm"
-        # Find the position of " - " separator
-        separator_idx = value_str.find(" - ")
-        if separator_idx == -1:
-            return None
-
+        # Format: "400nm - 620nm" (indices come from _wavelength_range_str())
         if self._editing_field == self.FIELD_WL_MIN:
-            # First field: from start to before "nm"
-            # Find the first "nm" which ends the min value
-            nm_idx = value_str.find("nm")
-            if nm_idx == -1:
-                return None
+            # First field: from start to the end of the first "nm"
             start_idx = 0
             end_idx = nm_idx + 2  # Include "nm"
         elif self._editing_field == self.FIELD_WL_MAX:
             # Second field: after " - " to end
-            start_idx = separator_idx + 3  # After " - "
+            start_idx = sep_idx + 3  # After " - "
             end_idx = len(value_str)
         else:
             return None
@@ -611,9 +1022,9 @@ class MenuSystem:
         text_field = value_str[start_idx:end_idx]
 
         # Calculate widths
-        width_before = self.font_value.size(text_before)[0] if text_before else 0
-        width_field = self.font_value.size(text_field)[0]
-        height = self.font_value.get_height()
+        width_before = self._text_width(text_before) if text_before else 0
+        width_field = self._text_width(text_field)
+        height = self._value_font_height
 
         # Calculate rectangle position
         rect_x = value_x + width_before
@@ -636,7 +1047,7 @@ class MenuSystem:
         assert self._editing_field is not None, "Editing field must be set"
 
         # Full datetime string: "YYYY-MM-DD HH:MM"
-        full_str = dt.strftime("%Y-%m-%d %H:%M")
+        full_str = self._format_datetime(dt)
 
         # Define field positions and their text in the format string
         # Format: "2025-11-09 13:21"
@@ -659,9 +1070,9 @@ class MenuSystem:
         text_field = full_str[start_idx:end_idx]
 
         # Calculate widths
-        width_before = self.font_value.size(text_before)[0] if text_before else 0
-        width_field = self.font_value.size(text_field)[0]
-        height = self.font_value.get_height()
+        width_before = self._text_width(text_before) if text_before else 0
+        width_field = self._text_width(text_field)
+        height = self._value_font_height
 
         # Calculate rectangle position
         rect_x = value_x + width_before
@@ -672,19 +1083,20 @@ class MenuSystem:
         return pygame.Rect(rect_x, rect_y, rect_width, rect_height)
 
     ##
-    # @brief Draws the hint text at the bottom of the screen.
+    # @brief Returns the hint text for the bottom of the screen.
+    # @return Hint string.
     # @details Shows different hints based on whether the user is in edit mode or navigation mode.
     #          For datetime editing, shows which field is currently selected.
-    def _draw_hints(self):
-        """Draws the hint text at the bottom of the screen."""
+    def _hint_text(self):
+        """Returns the hint text for the current menu state."""
         # Different hints for edit mode vs navigation mode
         if self._edit_mode:
-            selected_item = self._menu_items[self._selected_index]
-            if selected_item.get("type") == "datetime" and self._editing_field:
+            item_type = self._selected_type
+            if item_type == "datetime" and self._editing_field:
                 # Show which field is being edited
                 hint = f"A: Next/Save | B: Cancel | X/Y: Edit {self._editing_field.upper()}"
             elif (
-                selected_item.get("type") == "wavelength_range" and self._editing_field
+                item_type == "wavelength_range" and self._editing_field
             ):
                 # Show which wavelength field is being edited
                 field_name = (
@@ -695,142 +1107,207 @@ class MenuSystem:
                 hint = "A: Save | B: Cancel | X: Up | Y: Down"
         else:
             hint = "A: Select/Edit | X: Up | Y: Down"
+        return hint
 
-        hint_surface = self.font_info.render(hint, True, config.COLORS.YELLOW)
+    ##
+    # @brief Returns the blit for the hint text at the bottom of the screen.
+    # @param hint Hint string from _hint_text().
+    # @return (surface, rect) pair for Surface.blits().
+    def _hint_blit(self, hint):
+        """Returns the (surface, rect) that draws the hint text."""
+        hint_surface = self._render_text(self.font_info, hint, config.COLORS.YELLOW)
         hint_rect = hint_surface.get_rect(
             centerx=config.SCREEN_WIDTH // 2, bottom=config.SCREEN_HEIGHT - 5
         )
-        self.screen.blit(hint_surface, hint_rect)
+        return hint_surface, hint_rect
+
+    ##
+    # @brief Forces the next draw() to repaint the whole menu.
+    # @details Call this when another screen has drawn over the shared surface.
+    #          The offscreen composite is kept, so unless the menu itself changed
+    #          the repaint is a single blit.
+    def invalidate(self):
+        """Forces the next draw() to repaint the whole menu."""
+        self._last_draw_key = None
 
     ##
     # @brief Renders the complete menu to the screen.
     # @details Draws title, menu items with values, highlights selected item, and hint text.
     #          Selected items are shown in yellow, editing values in green.
     #          Info items (Date, Time, WiFi, IP) are shown in grey when unavailable.
+    #          Item values are resolved first; if nothing visible changed since the last
+    #          draw (and invalidate() was not called) the screen is left untouched.
+    #          The menu is rendered into an offscreen composite that is then blitted
+    #          to the screen, so a repaint after invalidate() only re-renders if the
+    #          menu contents changed in the meantime. When only some rows (or the
+    #          hint) changed, only those areas are repainted and copied, and
+    #          dirty_rects lists them for the display update.
+    # @return True if the screen was redrawn, False if it is unchanged.
     def draw(self):
-        """Renders the menu to the screen."""
-        self.screen.fill(config.COLORS.BLACK)
+        """Renders the menu to the screen. Returns True if anything was redrawn."""
+        # Loop invariants as locals (LOAD_FAST instead of attribute chains per item)
+        WHITE = config.COLORS.WHITE
+        YELLOW = config.COLORS.YELLOW
+        edit_idx = self._selected_index if self._edit_mode else -1
+        sel = self._selected_index
+
+        # Resolve what each item shows: (item, label color, value, value color, layout),
+        # where layout is the datetime shown for the date item, (nm_idx, sep_idx)
+        # for the wavelength range and None otherwise (used for the edit boxes).
+        # Each item's row function was chosen by type in _build_menu_items().
+        rows = []
+        for idx, item in enumerate(self._menu_items):
+            value, value_color, layout = item["_row"](self, item, idx == edit_idx)
+            rows.append(
+                (item, YELLOW if idx == sel else WHITE, value, value_color, layout)
+            )
 
-        # Title (original code style: centered at top=8)
-        title_surf = self.font_title.render(
-            "OPEN SPECTRO MENU", True, config.COLORS.YELLOW
+        # Skip the repaint if nothing visible changed (edit boxes and hints
+        # depend only on the selection/edit state and the values above)
+        draw_key = (
+            self._selected_index,
+            self._edit_mode,
+            self._editing_field,
+            tuple((row[1], row[2], row[3]) for row in rows),
         )
-        self.screen.blit(
-            title_surf, title_surf.get_rect(centerx=config.SCREEN_WIDTH // 2, top=8)
-        )
-
-        # Items (original spacing: MENU_MARGIN_TOP=38, MENU_SPACING=19, MENU_MARGIN_LEFT=12)
-        y_pos = config.MENU_MARGIN_TOP
-        for idx, item in enumerate(self._menu_items):
-            assert isinstance(item, dict), "Menu item must be a dictionary"
+        if draw_key == self._last_draw_key:
+            return False
+        screen_current = self._last_draw_key is not None  # Screen holds the old composite
+        self._last_draw_key = draw_key
 
-            color = config.COLORS.WHITE
-            if idx == self._selected_index:
-                color = config.COLORS.YELLOW
+        rects = None
+        if draw_key != self._composite_key:
+            rects = self._render_composite(rows)
+            self._composite_key = draw_key
 
-            # Draw Label
-            label_surface = self.font_item.render(item["label"], True, color)
-            self.screen.blit(label_surface, (config.MENU_MARGIN_LEFT, y_pos))
+        if screen_current and rects is not None:
+            for rect in rects:
+                self.screen.blit(self._composite, rect, rect)
+        else:
+            self.screen.blit(self._composite, (0, 0))
+            rects = None
+        self.dirty_rects = rects
+        return True
 
-            # Draw Value (if any)
-            value = None
-            value_color = config.COLORS.CYAN
+    ##
+    # @brief Brings the offscreen composite up to date with the resolved rows.
+    # @param rows Resolved rows from draw(): (item, label color, value, value color, layout).
+    # @return List of pygame.Rect areas repainted, or None if the whole composite was.
+    # @details Compares each row (and the hint) with what the composite already shows
+    #          and repaints only the bands that differ, each clipped to its rect so
+    #          overlapping neighbours come out exactly as in a full paint. Falls back
+    #          to a full paint the first time or when over half the screen changed.
+    def _render_composite(self, rows):
+        """Repaints the changed parts of _composite. Returns the rects, or None for all."""
+        surface = self._composite
+        hint = self._hint_text()
+        row_keys = [
+            (
+                color,
+                value,
+                value_color,
+                self._editing_field
+                if self._edit_mode and idx == self._selected_index
+                else False,
+            )
+            for idx, (_, color, value, value_color, _) in enumerate(rows)
+        ]
 
-            if "value_key" in item:
-                value = str(getattr(self.settings, item["value_key"]))
-                if self._edit_mode and idx == self._selected_index:
-                    value_color = config.COLORS.YELLOW
-
-            elif item["type"] == "datetime":
-                # Handle combined datetime item with offset
-                # Use edited datetime if currently editing this field, otherwise use display time
-                dt_to_display = (
-                    self._datetime_being_edited
-                    if self._edit_mode
-                    and idx == self._selected_index
-                    and self._datetime_being_edited
-                    else self.get_current_display_time()
+        rects = None
+        if self._composite_rows is not None:
+            width, height = surface.get_size()
+            rects = [
+                pygame.Rect(
+                    0,
+                    config.MENU_MARGIN_TOP + idx * config.MENU_SPACING,
+                    width,
+                    self._value_font_height,
+                )
+                for idx, key in enumerate(row_keys)
+                if key != self._composite_rows[idx]
+            ]
+            if hint != self._composite_hint:
+                hint_height = self.font_info.get_height()
+                rects.append(
+                    pygame.Rect(
+                        0, config.SCREEN_HEIGHT - 5 - hint_height, width, hint_height
+                    )
                 )
+            if sum(r.width * r.height for r in rects) > width * height // 2:
+                rects = None
 
-                # Combined format: "2025-11-09 13:21"
-                value = dt_to_display.strftime("%Y-%m-%d %H:%M")
-
-                # Change color to green when editing
-                if self._edit_mode and idx == self._selected_index:
-                    value_color = config.COLORS.YELLOW
-
-            elif item["type"] == "wavelength_range":
-                # Handle wavelength range item
-                # Use edited values if currently editing, otherwise use config values
-                if (
-                    self._edit_mode
-                    and idx == self._selected_index
-                    and self._wavelength_range_editing is not None
-                ):
-                    wl_min = self._wavelength_range_editing[0]
-                    wl_max = self._wavelength_range_editing[1]
-                    value_color = config.COLORS.YELLOW
-                else:
-                    wl_min = config.PLOTTING.WAVELENGTH_RANGE_MIN_NM
-                    wl_max = config.PLOTTING.WAVELENGTH_RANGE_MAX_NM
-
-                # Format: "400nm - 620nm"
-                value = f"{int(wl_min)}nm - {int(wl_max)}nm"
-
-            elif item["type"] == "fan_threshold":
-                # Handle fan threshold display with current temperature
-                if self.temp_sensor is not None:
-                    threshold = self.temp_sensor.get_fan_threshold_c()
-                    temp = self.temp_sensor.get_temperature_c()
-                    if isinstance(temp, (float, int)):
-                        value = f"Threshold {threshold}C (Current {temp:.0f}C)"
-                    else:
-                        value = f"Threshold {threshold}C (Temp: {temp})"
-                    if self._edit_mode and idx == self._selected_index:
-                        value_color = config.COLORS.YELLOW
-                else:
-                    value = "Not Available"
-                    value_color = config.COLORS.GRAY
-
-            elif item["type"] == "info":
-                # Handle info items (WiFi, IP)
-                display_type = item.get("display")
-                if display_type == "wifi":
-                    value = self.network_info.get_wifi_name()
-                    # Grey out if not connected
-                    if "Not Connected" in value or "Error" in value:
-                        value_color = config.COLORS.GRAY
-                elif display_type == "ip":
-                    value = self.network_info.get_ip_address()
-                    # Grey out if no IP
-                    if "No IP" in value or "Error" in value:
-                        value_color = config.COLORS.GRAY
+        if rects is None:
+            self._paint_composite(rows, hint)
+        else:
+            for rect in rects:
+                surface.set_clip(rect)
+                self._paint_composite(rows, hint)
+            surface.set_clip(None)
+
+        self._composite_rows = row_keys
+        self._composite_hint = hint
+        return rects
+
+    ##
+    # @brief Paints the whole menu into the composite (limited by its clip rect).
+    # @param rows Resolved rows from draw(): (item, label color, value, value color, layout).
+    # @param hint Hint string from _hint_text().
+    # @details Text is collected into one Surface.blits() call. The batch is flushed
+    #          before an edit box is drawn, so the box still lands under the next
+    #          row's text where the rows overlap, as with individual blits.
+    def _paint_composite(self, rows, hint):
+        """Paints title, items, edit boxes and hints into _composite."""
+        surface = self._composite
+        surface.fill(config.COLORS.BLACK)
+
+        # Title (original code style: centered at top=8)
+        title_surf = self._title_surf
+        blit_seq = [
+            (title_surf, title_surf.get_rect(centerx=config.SCREEN_WIDTH // 2, top=8))
+        ]
+
+        # Loop invariants as locals
+        BLUE = config.COLORS.BLUE
+        margin_left = config.MENU_MARGIN_LEFT
+        spacing = config.MENU_SPACING
+        value_right = surface.get_width() - 30
+        sel = self._selected_index
+        edit_idx = sel if self._edit_mode else -1
+        editing_field = self._editing_field
+        render_text = self._render_text
+        font_value = self.font_value
 
+        # Items (original spacing: MENU_MARGIN_TOP=38, MENU_SPACING=19, MENU_MARGIN_LEFT=12)
+        y_pos = config.MENU_MARGIN_TOP
+        for idx, (item, color, value, value_color, layout) in enumerate(rows):
+            # Draw Label
+            label_surface = item[
+                "_label_surf_yellow" if idx == sel else "_label_surf_white"
+            ]
+            blit_seq.append((label_surface, (margin_left, y_pos)))
+
+            # Draw Value (if any)
             if value:
-                value_surface = self.font_value.render(value, True, value_color)
-                value_x = self.screen.get_width() - 30 - value_surface.get_width()
-                self.screen.blit(value_surface, (value_x, y_pos))
+                value_surface = render_text(font_value, value, value_color)
+                value_x = value_right - value_surface.get_width()
+                blit_seq.append((value_surface, (value_x, y_pos)))
 
                 # Draw blue box around edited values
-                if self._edit_mode and idx == self._selected_index:
-                    if item["type"] == "datetime" and self._editing_field:
+                if idx == edit_idx:
+                    surface.blits(blit_seq, doreturn=False)
+                    blit_seq = []
+                    if item["type"] == "datetime" and editing_field:
                         # For datetime: box around specific field (year, month, day, hour, minute)
-                        field_rect = self._calculate_field_rect(
-                            dt_to_display, value_x, y_pos
-                        )
+                        field_rect = self._calculate_field_rect(layout, value_x, y_pos)
                         if field_rect:
-                            pygame.draw.rect(
-                                self.screen, config.COLORS.BLUE, field_rect, 1
-                            )
-                    elif item["type"] == "wavelength_range" and self._editing_field:
+                            pygame.draw.rect(surface, BLUE, field_rect, 1)
+                    elif item["type"] == "wavelength_range" and editing_field:
                         # For wavelength_range: box around specific field (min or max)
                         field_rect = self._calculate_wavelength_field_rect(
-                            value, value_x, y_pos
+                            value, *layout, value_x, y_pos
                         )
                         if field_rect:
-                            pygame.draw.rect(
-                                self.screen, config.COLORS.BLUE, field_rect, 1
-                            )
+                            pygame.draw.rect(surface, BLUE, field_rect, 1)
                     elif item["type"] in ["numeric", "choice", "fan_threshold"]:
                         # For numeric/choice/fan_threshold: box around entire value
                         value_rect = pygame.Rect(
@@ -839,9 +1316,10 @@ class MenuSystem:
                             value_surface.get_width() + 2,
                             value_surface.get_height(),
                         )
-                        pygame.draw.rect(self.screen, config.COLORS.BLUE, value_rect, 1)
+                        pygame.draw.rect(surface, BLUE, value_rect, 1)
 
-            y_pos += config.MENU_SPACING
+            y_pos += spacing
 
         # Draw the hint text at the bottom
-        self._draw_hints()
+        blit_seq.append(self._hint_blit(hint))
+        surface.blits(blit_seq, doreturn=False)
@@ -16,6 +16,7 @@ import time
 import numpy as np
 import pygame
 import config
+from ui.display_utils import draw_polyline, get_font
 
 
 ##
@@ -136,7 +137,9 @@ def apply_fast_smoothing(intensities: np.ndarray, window_size: int = 5) -> np.nd
     kernel = np.ones(window_size, dtype=np.float32) / window_size
 
     # Apply convolution with 'same' mode to maintain array size
-    smoothed = np.convolve(intensities.astype(np.float32), kernel, mode="same")
+    smoothed = np.convolve(
+        intensities.astype(np.float32, copy=False), kernel, mode="same"
+    )
 
     return smoothed
 
@@ -170,11 +173,16 @@ def prepare_display_data(
         max_wavelength=config.PLOTTING.WAVELENGTH_RANGE_MAX_NM,
     )
 
+    # Display-only path: narrow to float32 once so smoothing and decimation move
+    # half the bytes (the plotter stores float32 anyway; saves keep float64).
+    # Both crop branches return fresh arrays, so no extra copy is needed.
+    cropped_int = cropped_int.astype(np.float32, copy=False)
+
     # Step 2: Apply smoothing if requested
     if apply_smoothing and smoothing_window > 1:
         smoothed_intensities = apply_fast_smoothing(cropped_int, smoothing_window)
     else:
-        smoothed_intensities = cropped_int.copy()
+        smoothed_intensities = cropped_int
 
     # Step 3: Decimate for display performance
     return decimate_spectral_data_for_display(
@@ -243,22 +251,22 @@ class OptimizedPygamePlotter:
         try:
             ## @var axis_label_font
             # @brief Font for axis labels.
-            self.axis_label_font = pygame.font.Font(
+            self.axis_label_font = get_font(
                 config.FONTS.PLOTTER_AXIS_LABEL, config.FONT_SIZES.PLOTTER_AXIS
             )
         except:
-            self.axis_label_font = pygame.font.Font(
+            self.axis_label_font = get_font(
                 None, config.FONT_SIZES.PLOTTER_AXIS
             )
 
         try:
             ## @var tick_label_font
             # @brief Font for tick labels.
-            self.tick_label_font = pygame.font.Font(
+            self.tick_label_font = get_font(
                 config.FONTS.PLOTTER_TICK_LABEL, config.FONT_SIZES.PLOTTER_TICK
             )
         except:
-            self.tick_label_font = pygame.font.Font(
+            self.tick_label_font = get_font(
                 None, config.FONT_SIZES.PLOTTER_TICK
             )
 
@@ -345,11 +353,11 @@ class OptimizedPygamePlotter:
         self.display_y_data: np.ndarray | None = None
 
         ## @var screen_x_coords
-        # @brief Pre-computed screen X coordinates for plotting.
+        # @brief Pre-computed screen X coordinates for plotting (int16 pixels).
         self.screen_x_coords: np.ndarray | None = None
 
         ## @var screen_y_coords
-        # @brief Pre-computed screen Y coordinates for plotting.
+        # @brief Pre-computed screen Y coordinates for plotting (int16 pixels).
         self.screen_y_coords: np.ndarray | None = None
 
         ## @var x_min_val
@@ -418,7 +426,9 @@ class OptimizedPygamePlotter:
 
     ##
     # @brief Pre-compute X screen coordinates from wavelength data.
-    # @details Handles NaN/inf values by filtering them out.
+    # @details Handles NaN/inf values by filtering them out. Coordinates are stored as
+    #          whole pixels (truncated, as pygame.draw does with float points), so the
+    #          per-frame render only offsets and draws them.
     def _precompute_screen_x_coordinates(self):
         """Pre-compute X coordinates with NaN handling."""
         if self.display_x_data is None or len(self.display_x_data) == 0:
@@ -439,7 +449,7 @@ class OptimizedPygamePlotter:
         raw_coords = self.graph_area.left + normalized_x * self.graph_area.width
 
         # Store only finite coordinates
-        self.screen_x_coords = raw_coords[np.isfinite(raw_coords)].astype(np.float32)
+        self.screen_x_coords = raw_coords[np.isfinite(raw_coords)].astype(np.int16)
         if len(self.screen_x_coords) == 0:
             self.screen_x_coords = None
 
@@ -459,9 +469,9 @@ class OptimizedPygamePlotter:
 
         # Y data is expected to be already decimated to match display_x_data length
         if self.display_x_data is not None and len(y_data) == len(self.display_x_data):
-            self.display_y_data = y_data.copy().astype(np.float32)
+            self.display_y_data = y_data.astype(np.float32)
         elif len(y_data) == self.target_display_points:
-            self.display_y_data = y_data.copy().astype(np.float32)
+            self.display_y_data = y_data.astype(np.float32)
         else:
             # Fallback: resample if lengths don't match
             print(
@@ -484,7 +494,8 @@ class OptimizedPygamePlotter:
 
     ##
     # @brief Pre-compute Y screen coordinates from intensity data.
-    # @details Handles NaN/inf values and clamps to display range.
+    # @details Handles NaN/inf values and clamps to display range. Stored as int16
+    #          pixels, like the X coordinates.
     def _precompute_screen_y_coordinates(self):
         """Pre-compute Y coordinates with NaN handling."""
         if self.display_y_data is None or len(self.display_y_data) == 0:
@@ -508,7 +519,7 @@ class OptimizedPygamePlotter:
         raw_coords = self.graph_area.bottom - normalized_y * self.graph_area.height
 
         # Store only finite coordinates
-        self.screen_y_coords = raw_coords[np.isfinite(raw_coords)].astype(np.float32)
+        self.screen_y_coords = raw_coords[np.isfinite(raw_coords)].astype(np.int16)
         if len(self.screen_y_coords) == 0:
             self.screen_y_coords = None
 
@@ -689,7 +700,8 @@ class OptimizedPygamePlotter:
 
     ##
     # @brief Render the plot line.
-    # @details Only redraws if needs_plot_redraw flag is set. Handles NaN/inf safely.
+    # @details Only redraws if needs_plot_redraw flag is set. NaN/inf values were already
+    #          dropped when the integer screen coordinates were precomputed.
     def _render_plot_line(self):
         """Render spectral data line with proper NaN/inf handling."""
         if not self.needs_plot_redraw:
@@ -708,44 +720,21 @@ class OptimizedPygamePlotter:
             self.needs_plot_redraw = False
             return
 
-        # Convert coordinates relative to the plot_widget_rect
-        plot_x_coords = self.screen_x_coords - self.plot_widget_rect.left
-        plot_y_coords = self.screen_y_coords - self.plot_widget_rect.top
-
         try:
-            # Filter out NaN and infinite values before pygame
-            finite_mask = np.isfinite(plot_x_coords) & np.isfinite(plot_y_coords)
-            if not np.any(finite_mask):  # No valid points
-                self.needs_plot_redraw = False
-                return
-
-            valid_x = plot_x_coords[finite_mask]
-            valid_y = plot_y_coords[finite_mask]
-
-            if len(valid_x) < 2:  # Need at least 2 points to draw lines
-                self.needs_plot_redraw = False
-                return
-
-            # Create point list with guaranteed finite values
-            points_array = np.column_stack((valid_x, valid_y))
-            point_list = [(float(x), float(y)) for x, y in points_array]
-
-            if len(point_list) > 1:
-                # Set clipping rectangle
-                clip_rect = pygame.Rect(
-                    self.graph_area.left - self.plot_widget_rect.left,
-                    self.graph_area.top - self.plot_widget_rect.top,
-                    self.graph_area.width,
-                    self.graph_area.height,
-                )
-                self.plot_surface.set_clip(clip_rect)
-
-                # Draw the lines
-                pygame.draw.lines(
-                    self.plot_surface, self.plot_color, False, point_list, 1
-                )
-
-                self.plot_surface.set_clip(None)  # Reset clipping
+            # Convert coordinates relative to the plot_widget_rect (integer math only)
+            plot_x_coords = self.screen_x_coords - self.plot_widget_rect.left
+            plot_y_coords = self.screen_y_coords - self.plot_widget_rect.top
+
+            # Draw the line clipped to the graph area (points converted in one NumPy call)
+            clip_rect = pygame.Rect(
+                self.graph_area.left - self.plot_widget_rect.left,
+                self.graph_area.top - self.plot_widget_rect.top,
+                self.graph_area.width,
+                self.graph_area.height,
+            )
+            draw_polyline(
+                self.plot_surface, self.plot_color, plot_x_coords, plot_y_coords, clip_rect
+            )
 
         except Exception as e:
             print(f"ERROR: Error rendering plot line: {e}")
@@ -849,7 +838,7 @@ class FastSpectralRenderer:
 
         ## @var _last_raw_data_hash
         # @brief MD5 hash of last raw data for cache validation.
-        self._last_raw_data_hash: str | None = None
+        self._last_raw_data_hash: bytes | None = None
 
         ## @var _cached_display_data
         # @brief Cached processed display data.
@@ -902,7 +891,8 @@ class FastSpectralRenderer:
             return False
 
         if not force_update:
-            data_hash = hashlib.md5(intensities.tobytes()).hexdigest()
+            # Hash the array's buffer in place; tobytes() would copy the spectrum first
+            data_hash = hashlib.md5(np.ascontiguousarray(intensities)).digest()
             if (
                 data_hash == self._last_raw_data_hash
                 and self._cached_display_data is not None
@@ -42,10 +42,12 @@ import numpy as np
 from typing import Optional
 
 import config
+from ui import display_utils
 from ui.plotting import FastSpectralRenderer, prepare_display_data
 from hardware.spectrometer_controller import (
     SpectrometerCommand,
     SpectrometerResult,
+    LatestResultQueue,
     CMD_START_SESSION,
     CMD_STOP_SESSION,
     CMD_UPDATE_SETTINGS,
@@ -100,13 +102,19 @@ class SpectrometerScreen:
     CALIB_MENU_AUTO_INT = 2
     CALIB_MENU_OPTIONS = ["Dark Reference", "White Reference", "Auto Integration"]
 
+    # Live result types where a newer result fully supersedes an older one
+    SUPERSEDED_SPECTRA_TYPES = (
+        config.MODES.SPECTRA_TYPE_RAW,
+        config.MODES.SPECTRA_TYPE_REFLECTANCE,
+    )
+
     def __init__(
         self,
         screen: pygame.Surface,
         button_handler,
         settings,
         request_queue: queue.Queue,
-        result_queue: queue.Queue,
+        result_queue: LatestResultQueue,
         save_queue: queue.Queue,
     ):
         """
@@ -142,7 +150,8 @@ class SpectrometerScreen:
             max_display_points=config.PLOTTING.TARGET_DISPLAY_POINTS,
         )
 
-        # Current data
+        # Current data (_current_result owns the pooled buffers referenced below)
+        self._current_result: Optional[SpectrometerResult] = None
         self._current_wavelengths: Optional[np.ndarray] = None
         self._current_intensities: Optional[np.ndarray] = None
         self._current_timestamp: Optional[datetime.datetime] = None
@@ -234,18 +243,18 @@ class SpectrometerScreen:
     def _load_fonts(self):
         """Load fonts for text rendering."""
         try:
-            self.font_title = pygame.font.Font(
+            self.font_title = display_utils.get_font(
                 config.FONTS.TITLE, config.FONT_SIZES.TITLE
             )
-            self.font_info = pygame.font.Font(
+            self.font_info = display_utils.get_font(
                 config.FONTS.SPECTRO, config.FONT_SIZES.SPECTRO
             )
-            self.font_hint = pygame.font.Font(config.FONTS.HINT, config.FONT_SIZES.HINT)
+            self.font_hint = display_utils.get_font(config.FONTS.HINT, config.FONT_SIZES.HINT)
         except:
             # Fallback to system fonts
-            self.font_title = pygame.font.Font(None, config.FONT_SIZES.TITLE)
-            self.font_info = pygame.font.Font(None, config.FONT_SIZES.SPECTRO)
-            self.font_hint = pygame.font.Font(None, config.FONT_SIZES.HINT)
+            self.font_title = display_utils.get_font(None, config.FONT_SIZES.TITLE)
+            self.font_info = display_utils.get_font(None, config.FONT_SIZES.SPECTRO)
+            self.font_hint = display_utils.get_font(None, config.FONT_SIZES.HINT)
 
     def _are_references_valid_for_reflectance(self) -> tuple[bool, str]:
         """
@@ -1472,18 +1481,39 @@ class SpectrometerScreen:
         Update screen state and process results from controller.
 
         This method:
-        - Reads results from the result queue
+        - Drains all pending results from the result queue
         - Validates session_id (only accept is_valid=True results)
-        - Updates plot with new data
+        - Updates plot with the newest live spectrum (older live spectra
+          in the same batch are released without being processed)
         - Updates reference status flags
         """
-        # Process all pending results
+        # Drain everything pending before processing anything
+        results = []
+        get_nowait = self.result_queue.get_nowait
         while True:
             try:
-                result: SpectrometerResult = self.result_queue.get_nowait()
-                self._process_result(result)
+                results.append(get_nowait())
             except queue.Empty:
                 break
+        if not results:
+            return
+
+        # Only the newest valid live spectrum is worth plotting this frame
+        superseded_types = self.SUPERSEDED_SPECTRA_TYPES
+        latest_live = None
+        for result in results:
+            if result.is_valid and result.spectra_type in superseded_types:
+                latest_live = result
+
+        for result in results:
+            if (
+                result is not latest_live
+                and result.is_valid
+                and result.spectra_type in superseded_types
+            ):
+                result.release()
+                continue
+            self._process_result(result)
 
     def _process_result(self, result: SpectrometerResult):
         """
@@ -1497,27 +1527,37 @@ class SpectrometerScreen:
             print(
                 f"SpectrometerScreen: Discarding invalid scan (session_id={result.session_id})"
             )
+            result.release()
             return
 
         # Handle auto-integration results specially
         if result.spectra_type == config.MODES.SPECTRA_TYPE_AUTO_INTEG:
             if self._state == self.STATE_AUTO_INTEG_RUNNING:
                 self._process_auto_integ_result(result)
+            result.release()
             return
 
         # Update reference status flags (from controller captures)
         if result.spectra_type == config.MODES.SPECTRA_TYPE_DARK_REF:
             self._has_dark_ref = True
             print("SpectrometerScreen: Dark reference updated (from controller)")
+            result.release()
             return
         elif result.spectra_type == config.MODES.SPECTRA_TYPE_WHITE_REF:
             self._has_white_ref = True
             print("SpectrometerScreen: White reference updated (from controller)")
+            result.release()
             return
 
-        # Update current data (for live view and reference capture)
-        self._current_wavelengths = result.wavelengths
-        self._current_intensities = result.intensities
+        # Update current data (for live view and reference capture). The previous
+        # result's buffers go back to the controller's pool; anything that must
+        # outlive it (frozen data, plot data) has already been copied.
+        if self._current_result is not None:
+            self._current_result.release()
+        self._current_result = result
+        wavelengths, intensities = result.as_numpy()
+        self._current_wavelengths = wavelengths
+        self._current_intensities = intensities
         self._current_timestamp = result.timestamp
         self._current_integration_ms = result.integration_time_ms
         self._current_raw_intensities = result.raw_intensities  # For reflectance saves
@@ -1533,15 +1573,15 @@ class SpectrometerScreen:
             # Set wavelengths if not already set
             if self.renderer.plotter.original_x_data is None:
                 print(
-                    f"SpectrometerScreen: Setting wavelengths (length: {len(result.wavelengths)})"
+                    f"SpectrometerScreen: Setting wavelengths (length: {len(wavelengths)})"
                 )
-                self.renderer.set_wavelengths(result.wavelengths)
+                self.renderer.set_wavelengths(wavelengths)
 
             # Verify array lengths match before updating
-            if len(result.intensities) != len(result.wavelengths):
+            if len(intensities) != len(wavelengths):
                 print(
-                    f"ERROR: Array length mismatch! Wavelengths: {len(result.wavelengths)}, "
-                    f"Intensities: {len(result.intensities)}"
+                    f"ERROR: Array length mismatch! Wavelengths: {len(wavelengths)}, "
+                    f"Intensities: {len(intensities)}"
                 )
                 return
 
@@ -1562,7 +1602,7 @@ class SpectrometerScreen:
 
             # Update spectrum
             self.renderer.update_spectrum(
-                result.intensities,
+                intensities,
                 apply_smoothing=config.PLOTTING.USE_LIVE_SMOOTHING,
                 force_update=False,
             )
@@ -1576,6 +1616,9 @@ class SpectrometerScreen:
         - Draws the plot (live or frozen) or calibration menu
         - Draws status information
         - Draws hint text
+
+        Returns:
+            True (the screen is always fully redrawn)
         """
         self.screen.fill(config.COLORS.BLACK)
 
@@ -1606,6 +1649,7 @@ class SpectrometerScreen:
 
         # Draw hint text
         self._draw_hint_text()
+        return True
 
     def _draw_live_plot(self):
         """Draw the live plot."""
@@ -25,14 +25,14 @@ def show(screen, button_handler, leak_detected_flag):
 
     # Load fonts (matching original code)
     try:
-        font_disclaimer = pygame.font.Font(config.FONTS.MAIN, config.FONT_SIZES.DISCLAIMER)
+        font_disclaimer = display_utils.get_font(config.FONTS.MAIN, config.FONT_SIZES.DISCLAIMER)
     except:
-        font_disclaimer = pygame.font.Font(None, config.FONT_SIZES.DISCLAIMER)
+        font_disclaimer = display_utils.get_font(None, config.FONT_SIZES.DISCLAIMER)
 
     try:
-        font_hint = pygame.font.Font(config.FONTS.HINT, config.FONT_SIZES.HINT)
+        font_hint = display_utils.get_font(config.FONTS.HINT, config.FONT_SIZES.HINT)
     except:
-        font_hint = pygame.font.Font(None, config.FONT_SIZES.HINT)
+        font_hint = display_utils.get_font(None, config.FONT_SIZES.HINT)
 
     # Render each line individually (original code approach)
     lines = config.DISCLAIMER_TEXT.splitlines()
@@ -339,7 +339,7 @@ Type=simple
 User=$ACTUAL_USER
 WorkingDirectory=$PROJECT_DIR_PATH
 Environment="PATH=$VENV_PATH/bin:/usr/local/bin:/usr/bin:/bin"
-ExecStart=$VENV_PATH/bin/python main.py
+ExecStart=$VENV_PATH/bin/python -OO main.py
 Restart=on-failure
 RestartSec=5
 
@@ -524,6 +524,11 @@ copy_project_files_custom() {
         sudo -u "$ACTUAL_USER" cp "$APP_SRC_DIR/requirements.txt" "$PROJECT_DIR_PATH/"
     fi
 
+    # Purge bytecode caches: cp -r merges into the old tree and copies any caches
+    # from the source, so .pyc files for renamed/removed modules would linger
+    info "Removing stale __pycache__ directories..."
+    sudo find "$PROJECT_DIR_PATH" -type d -name "__pycache__" -prune -exec rm -rf {} +
+
     sudo chown -R "$ACTUAL_USER:$ACTUAL_USER" "$PROJECT_DIR_PATH"
     info "Project files copied successfully."
 }